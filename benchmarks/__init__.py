@@ -0,0 +1,2 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
@@ -0,0 +1,82 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+"""Benchmark runner.
+
+    python -m beehive.benchmarks run [-o results.json] [--number N] [--repeat R]
+    python -m beehive.benchmarks compare baseline.json current.json [--threshold 10]
+
+`compare` exits with status 1 when any benchmark got slower by more than
+`threshold` percent.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Dict
+from . import hot_paths
+
+def run(args) -> int:
+    results = hot_paths.run(number=args.number, repeat=args.repeat)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": int(time.time()),
+        },
+        "results": results,
+    }
+    for name, result in results.items():
+        print(f"{name:<16} {result['ns_per_op']:>12.1f} ns/op")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {args.output}")
+    return 0
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def compare(args) -> int:
+    baseline, current = _load(args.baseline), _load(args.current)
+    regressions = 0
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline or name not in current:
+            print(f"{name:<16} {'only in ' + (args.current if name in current else args.baseline)}")
+            continue
+        old, new = baseline[name]["ns_per_op"], current[name]["ns_per_op"]
+        change = (new - old) / old * 100 if old else 0.0
+        status = ""
+        if change > args.threshold:
+            status = "REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            status = "improved"
+        print(f"{name:<16} {old:>12.1f} -> {new:>12.1f} ns/op {change:>+8.1f}%  {status}")
+    if regressions:
+        print(f"{regressions} regression(s) above {args.threshold}%")
+    return 1 if regressions else 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m beehive.benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="run the hot-path benchmarks")
+    run_parser.add_argument("-o", "--output", help="write results as JSON to this path")
+    run_parser.add_argument("--number", type=int, default=20_000, help="operations per timing run")
+    run_parser.add_argument("--repeat", type=int, default=5, help="timing runs per benchmark (best is kept)")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = sub.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown flagged as a regression")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+"""Compares cache memory and lookup cost for str vs. int snowflake keys.
+
+Run with `python -m beehive.benchmarks.cache_keys [count]`.
+"""
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+from ..snowflake import snowflake_from_time
+
+def _make_ids(count: int, seed: int = 1337) -> List[int]:
+    rng = random.Random(seed)
+    base = snowflake_from_time(1700000000)
+    return [base + rng.getrandbits(40) for _ in range(count)]
+
+def _measure(build: Callable[[], Dict[Any, object]]) -> int:
+    tracemalloc.start()
+    cache = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return size
+
+def run(count: int = 100_000) -> Dict[str, float]:
+    """Builds a cache of `count` entries with each key type and reports bytes and lookup time"""
+    ids = _make_ids(count)
+    raw = [str(i) for i in ids]
+    value = object()
+
+    # Both builds allocate fresh key objects, as when keys come from decoded payloads
+    str_bytes = _measure(lambda: {str(i): value for i in ids})
+    int_bytes = _measure(lambda: {int(s): value for s in raw})
+
+    str_cache = {s: value for s in raw}
+    int_cache = {i: value for i in ids}
+    # Lookups use fresh key objects, as happens when IDs arrive in new payloads
+    str_probe = [str(i) for i in ids[:10_000]]
+    int_probe = [int(s) for s in str_probe]
+    str_lookup = min(timeit.repeat(lambda: [str_cache[k] for k in str_probe], number=10, repeat=5))
+    int_lookup = min(timeit.repeat(lambda: [int_cache[k] for k in int_probe], number=10, repeat=5))
+
+    return {
+        "entries": count,
+        "str_key_bytes": str_bytes,
+        "int_key_bytes": int_bytes,
+        "bytes_saved_pct": round(100 * (str_bytes - int_bytes) / str_bytes, 2),
+        "str_lookup_ns": round(str_lookup / (10 * len(str_probe)) * 1e9, 2),
+        "int_lookup_ns": round(int_lookup / (10 * len(int_probe)) * 1e9, 2),
+    }
+
+if __name__ == "__main__":
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
+    for key, value in results.items():
+        print(f"{key}: {value}")
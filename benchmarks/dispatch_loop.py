@@ -0,0 +1,68 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+"""Measures Bot.handle dispatch throughput on the default event loop vs. uvloop.
+
+Run with `python -m beehive.benchmarks.dispatch_loop [events]`.
+"""
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from typing import Any, Dict, List, Optional
+from ..bot import Bot
+
+def _make_events(count: int) -> List[Dict[str, Any]]:
+    events = []
+    for i in range(count):
+        events.append({
+            "_event_type": "MESSAGE_CREATE",
+            "id": str(1100000000000000000 + i),
+            "channel_id": "1000000000000000001",
+            "author": {"id": "2000000000000000002"},
+            "content": f"message {i}",
+        })
+    return events
+
+async def _dispatch(count: int, concurrency: int) -> float:
+    async with Bot() as bot:
+        bot.user_id = 1
+
+        @bot.event("MESSAGE_CREATE")
+        async def on_message_create(data):
+            # Yield once so the loop's scheduling cost is part of the measurement
+            await asyncio.sleep(0)
+
+        events = _make_events(count)
+        start = time.perf_counter()
+        for i in range(0, count, concurrency):
+            await asyncio.gather(*(bot.handle(event) for event in events[i:i + concurrency]))
+        return time.perf_counter() - start
+
+def _run_on(loop_factory, count: int, concurrency: int) -> float:
+    loop = loop_factory()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed = loop.run_until_complete(_dispatch(count, concurrency))
+    finally:
+        loop.close()
+    return count / elapsed
+
+def run(count: int = 50_000, concurrency: int = 100) -> Dict[str, Optional[float]]:
+    """Dispatches `count` MESSAGE_CREATE events per loop and reports events/sec"""
+    results: Dict[str, Optional[float]] = {
+        "events": count,
+        "default_events_per_sec": round(_run_on(asyncio.new_event_loop, count, concurrency), 1),
+        "uvloop_events_per_sec": None,
+    }
+    try:
+        import uvloop
+    except ImportError:
+        return results
+    results["uvloop_events_per_sec"] = round(_run_on(uvloop.new_event_loop, count, concurrency), 1)
+    return results
+
+if __name__ == "__main__":
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
+    for key, value in results.items():
+        print(f"{key}: {value}")
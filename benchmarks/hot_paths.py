@@ -0,0 +1,107 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+"""Micro-benchmarks for the library's per-message hot paths.
+
+Every benchmark uses fixed inputs so results from different runs and
+machines can be compared with `python -m beehive.benchmarks compare`.
+"""
+import asyncio
+import contextlib
+import io
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+
+MESSAGE_PAYLOAD = {
+    "id": "1180000000000000001",
+    "channel_id": "1000000000000000001",
+    "guild_id": "900000000000000001",
+    "author": {"id": "2000000000000000002", "username": "bench", "discriminator": "0"},
+    "content": '!echo "hello there" 42 3.5',
+    "timestamp": "2024-01-01T00:00:00.000000+00:00",
+    "edited_timestamp": None,
+    "attachments": [],
+    "embeds": [],
+    "reactions": [],
+}
+COMMAND_CONTENT = '!echo "hello there general kenobi" 42 3.5 trailing words here'
+FRAME = json.dumps({"op": 0, "t": "MESSAGE_CREATE", "s": 42, "d": MESSAGE_PAYLOAD})
+
+def _make_bot():
+    from ..bot import Bot
+
+    bot = Bot(command_prefix="!")
+    bot.user_id = 1
+
+    @bot.command(name="echo")
+    async def echo(ctx, text: str, count: int = 1, ratio: float = 1.0, extra: Optional[str] = None):
+        pass
+
+    @bot.event("MESSAGE_CREATE")
+    async def on_message_create(data):
+        pass
+
+    return bot
+
+async def _async_make_bot():
+    # Built inside the loop so the bot's HTTP session belongs to it
+    return _make_bot()
+
+class _NullHandler:
+    user_id = None
+
+    async def handle(self, event_data):
+        pass
+
+def _time_sync(func: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+def _time_async(loop, func: Callable[[], Any], number: int) -> float:
+    async def runner():
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+        return time.perf_counter() - start
+    return loop.run_until_complete(runner())
+
+def run(number: int = 20_000, repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Runs every hot-path benchmark and returns the best ns/op of `repeat` runs"""
+    from ..context import Message
+    from ..gateway import GatewayClient
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            bot = loop.run_until_complete(_async_make_bot())
+            handler = bot.command_handler
+            command = handler._get_command("echo")
+            _, args = handler._parse_args(COMMAND_CONTENT)
+            gateway = GatewayClient("token", _NullHandler())
+            event = dict(MESSAGE_PAYLOAD, _event_type="MESSAGE_CREATE")
+
+            cases = {
+                "parse_args": lambda: handler._parse_args(COMMAND_CONTENT),
+                "get_command": lambda: handler._get_command("echo"),
+                "convert_args": lambda: handler._convert_args(command, args),
+                "message_init": lambda: Message(MESSAGE_PAYLOAD),
+            }
+            async_cases = {
+                "bot_handle": lambda: bot.handle(dict(event)),
+                "gateway_decode": lambda: gateway.dispatch_frame(FRAME),
+            }
+
+            for name, func in cases.items():
+                best = min(_time_sync(func, number) for _ in range(repeat))
+                results[name] = {"ns_per_op": round(best / number * 1e9, 1), "ops": number}
+            for name, func in async_cases.items():
+                best = min(_time_async(loop, func, number) for _ in range(repeat))
+                results[name] = {"ns_per_op": round(best / number * 1e9, 1), "ops": number}
+
+            loop.run_until_complete(bot.close())
+    finally:
+        loop.close()
+    return results
@@ -0,0 +1,85 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+"""Compares peak memory of decoding a large READY frame whole vs. streamed.
+
+Run with `python -m beehive.benchmarks.ready_memory [guilds] [members_per_guild]`.
+Both paths end with the same entities in a ConnectionState; the difference
+in peak is the transient fully-built payload.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+from ..jsonstream import loads_streamed
+from ..state import ConnectionState
+
+def make_ready_frame(guilds: int, members: int, channels: int = 30) -> str:
+    base = 1100000000000000000
+    payload = {
+        "t": "READY",
+        "s": 1,
+        "op": 0,
+        "d": {
+            "v": 9,
+            "user": {"id": str(base), "username": "bench"},
+            "session_id": "0" * 32,
+            "guilds": [
+                {
+                    "id": str(base + g * 100000),
+                    "name": f"guild {g}",
+                    "member_count": members,
+                    "channels": [
+                        {"id": str(base + g * 100000 + 1 + c), "name": f"channel-{c}", "type": 0, "position": c, "topic": "x" * 40}
+                        for c in range(channels)
+                    ],
+                    "members": [
+                        {"user": {"id": str(base + g * 100000 + 1000 + m), "username": f"user{m}", "avatar": "a" * 32}, "roles": [], "joined_at": "2024-01-01T00:00:00+00:00"}
+                        for m in range(members)
+                    ],
+                    "presences": [
+                        {"user": {"id": str(base + g * 100000 + 1000 + m)}, "status": "online", "activities": []}
+                        for m in range(members // 2)
+                    ],
+                }
+                for g in range(guilds)
+            ],
+        },
+    }
+    return json.dumps(payload)
+
+def _full(raw: str, state: ConnectionState) -> None:
+    state.ingest_ready(json.loads(raw)["d"])
+
+def _streamed(raw: str, state: ConnectionState) -> None:
+    frame = loads_streamed(raw, ConnectionState.ITEM_KEYS, state.ingest_item)
+    state.add_user(frame["d"].get("user"))
+
+def _measure(func: Callable[[str, ConnectionState], None], raw: str) -> Dict[str, Any]:
+    state = ConnectionState()
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(raw, state)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "peak_mb": round(peak / 2 ** 20, 2),
+        "retained_mb": round(retained / 2 ** 20, 2),
+        "seconds": round(elapsed, 3),
+        "guilds": len(state.guilds),
+        "users": len(state.users),
+    }
+
+def run(guilds: int = 200, members: int = 500) -> Dict[str, Any]:
+    raw = make_ready_frame(guilds, members)
+    return {
+        "frame_mb": round(len(raw) / 2 ** 20, 2),
+        "full": _measure(_full, raw),
+        "streamed": _measure(_streamed, raw),
+    }
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    for key, value in run(*args).items():
+        print(f"{key}: {value}")
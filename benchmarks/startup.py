@@ -0,0 +1,68 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+"""Measures cold-start import cost with `python -X importtime`.
+
+Run with `python -m beehive.benchmarks.startup`. Each statement is imported in
+a fresh interpreter, and the report lists the total cumulative import time of
+the package plus its heaviest imports.
+"""
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+PACKAGE = __package__.rpartition(".")[0]
+# The package's public API lives in init.py rather than __init__.py, so the
+# statements import it explicitly; a bare `import beehive` loads nothing
+INIT = f"{PACKAGE}.init"
+
+# (label, statement) pairs covering what short-lived workers typically import
+STATEMENTS = [
+    ("package", f"import {INIT}"),
+    ("command", f"from {INIT} import Command, CommandError"),
+    ("exceptions", f"from {INIT} import DiscordError, RateLimitError"),
+    ("bot", f"from {INIT} import Bot"),
+]
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parses `import time: self | cumulative | name` lines into (name, depth, self_us, cumulative_us)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+def measure(statement: str, top: int = 5) -> Dict[str, Any]:
+    """Runs `statement` in a fresh interpreter and summarizes its import times"""
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1]}
+
+    rows = _parse_importtime(proc.stderr)
+    total_us = sum(cumulative for _, depth, _, cumulative in rows if depth == 0)
+    heaviest = sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+    return {
+        "wall_ms": round(wall * 1000, 2),
+        "import_ms": round(total_us / 1000, 2),
+        "modules": len(rows),
+        "heaviest": {name: self_us for name, _, self_us, _ in heaviest},
+    }
+
+def run() -> Dict[str, Dict[str, Any]]:
+    return {label: measure(statement) for label, statement in STATEMENTS}
+
+if __name__ == "__main__":
+    for label, result in run().items():
+        print(f"{label}: {result}")
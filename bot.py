@@ -1,17 +1,27 @@
 # MIT License
 # Copyright (c) 2025 JinxedUp
 import asyncio
+import hashlib
 import httpx
-import random
-import time
 from typing import Dict, Optional, List, Any
 from .command_handler import CommandHandler
-from .context import Context
-from .gateway import GatewayClient
+from .context import Context, Message
+from .outbound import OutboundQueue
+from .state import ConnectionState
+from .triggers import Trigger, TriggerMatcher
+from .tasks import Loop, TimerWheel
+from .extensions import ExtensionManager
+from .executors import CommandExecutor
+from .utils import install_uvloop
+from .snowflake import Snowflake, SnowflakeLike, parse_snowflake
 from .command import Command, CommandError, BadArgument, MissingRequiredArgument, CommandNotFound, CommandInvokeError
 
+def _token_fingerprint(token: str) -> str:
+    """Identifies the account a snapshot was saved for without storing the token itself"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 class Bot:
-    def __init__(self, command_prefix="!", intents=None, is_bot=False):
+    def __init__(self, command_prefix="!", intents=None, is_bot=False, thread_pool_size=None, process_pool_size=None):
         print("Initializing bot...")
         self.command_prefix = command_prefix
         self.intents = intents or {}
@@ -20,64 +30,99 @@ class Bot:
         self.session = httpx.AsyncClient()
         self.command_handler = CommandHandler(self)
         self.token = None
-        self.user_id = None
+        self.user_id: Optional[Snowflake] = None
         self.is_bot = is_bot
         self._last_message_time = 0
-        self._message_queue = asyncio.Queue()
-        self._message_task = None
-        self._context_cache: Dict[str, Context] = {}
+        self._message_queue = OutboundQueue()
+        self.upload_stats = {"uploads": 0, "bytes": 0, "seconds": 0.0}
+        self.executor = CommandExecutor(thread_pool_size, process_pool_size)
+        self.shards = {}
+        self.ipc = None
+        self.ipc_handlers = {}
+        self.gateway_recorder = None
+        self.watchdog = None
+        self.state = ConnectionState()
+        self.triggers = TriggerMatcher()
+        self.timer_wheel = TimerWheel()
+        self.loops: List[Loop] = []
+        self.extensions = ExtensionManager(self)
+        self.state_store = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._saved_sessions: Dict[Optional[int], Dict[str, Any]] = {}
+        self._gateway_task: Optional[asyncio.Task] = None
+        self._close_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._context_cache: Dict[Snowflake, Context] = {}
+        self._register_default_commands()
         print(f"Bot initialized with prefix: {command_prefix}")
 
-@self.command(name="help")
-async def help_command(ctx, *, command: Optional[str] = None):
-    """Shows help for all commands or a specific command."""
-    if not command:
-        if not self.commands:
-            await ctx.send("No commands available.")
-            return
+    def _register_default_commands(self):
+        """Registers the built-in help and spam commands"""
+        @self.command(name="help")
+        async def help_command(ctx, *, command: Optional[str] = None):
+            """Shows help for all commands or a specific command."""
+            if not command:
+                if not self.commands:
+                    await ctx.send("No commands available.")
+                    return
+
+                help_msg = "**Available Commands:**\n"
+                for name, cmd in sorted(self.commands.items()):
+                    help_msg += f"• `{self.command_prefix}{name}`"
+                    if hasattr(cmd, 'aliases') and cmd.aliases:
+                        help_msg += f" (aliases: {', '.join(cmd.aliases)})"
+                    help_msg += f": {cmd.description or 'No description.'}\n"
+                await ctx.send(help_msg)
+                return
 
-        help_msg = "**Available Commands:**\n"
-        for name, cmd in sorted(self.commands.items()):
-            help_msg += f"• `{self.command_prefix}{name}`"
+            command_lower = command.lower()
+            cmd = None
+            for name, c in self.commands.items():
+                if name.lower() == command_lower or (hasattr(c, 'aliases') and command_lower in [alias.lower() for alias in c.aliases]):
+                    cmd = c
+                    break
+
+            if not cmd:
+                await ctx.send(f"Command `{command}` not found.")
+                return
+
+            help_msg = f"**{self.command_prefix}{cmd.name}**\n"
             if hasattr(cmd, 'aliases') and cmd.aliases:
-                help_msg += f" (aliases: {', '.join(cmd.aliases)})"
-            help_msg += f": {cmd.description or 'No description.'}\n"
-        await ctx.send(help_msg)
-        return
-
-    command_lower = command.lower()
-    cmd = None
-    for name, c in self.commands.items():
-        if name.lower() == command_lower or (hasattr(c, 'aliases') and command_lower in [alias.lower() for alias in c.aliases]):
-            cmd = c
-            break
-
-    if not cmd:
-        await ctx.send(f"Command `{command}` not found.")
-        return
-
-    help_msg = f"**{self.command_prefix}{cmd.name}**\n"
-    if hasattr(cmd, 'aliases') and cmd.aliases:
-        help_msg += f"Aliases: {', '.join(cmd.aliases)}\n"
-    help_msg += f"Description: {cmd.description or 'No description.'}\n"
-
-    if hasattr(cmd, '_signature') and cmd._signature:
-        help_msg += "\nParameters:\n"
-        for pname, param in cmd._signature.items():
-            required = "Required" if param.get('required', False) else "Optional"
-            ptype = param.get('type', str).__name__
-            help_msg += f"- {pname} ({ptype}, {required})"
-            if param.get('description'):
-                help_msg += f": {param['description']}"
-            help_msg += "\n"
-
-    await ctx.send(help_msg)
-
-    def command(self, name=None):
-        """Command decorator"""
+                help_msg += f"Aliases: {', '.join(cmd.aliases)}\n"
+            help_msg += f"Description: {cmd.description or 'No description.'}\n"
+
+            if hasattr(cmd, '_signature') and cmd._signature:
+                help_msg += "\nParameters:\n"
+                for pname, param in cmd._signature.items():
+                    required = "Required" if param.get('required', False) else "Optional"
+                    ptype = param.get('type', str).__name__
+                    help_msg += f"- {pname} ({ptype}, {required})"
+                    if param.get('description'):
+                        help_msg += f": {param['description']}"
+                    help_msg += "\n"
+
+            await ctx.send(help_msg)
+
+        @self.command()
+        async def spam(ctx, text: str, count: int = 0, delay: float = 2.0):
+            """
+            Spam a message in the channel.
+            Usage:
+              !spam <text>            
+              !spam <text> <count>    
+              !spam <text> <count> <delay>  
+            """
+            await ctx.spam(text, count=count, delay=delay)
+
+    def command(self, name=None, executor=None):
+        """Command decorator.
+
+        executor="thread" or "process" runs a regular (non-async) callback in
+        the bot's thread or process pool; it receives only the command
+        arguments and its return value is sent to the channel."""
         def decorator(func):
             cmd_name = name or func.__name__
-            self.commands[cmd_name] = Command(cmd_name, func)
+            self.commands[cmd_name] = Command(cmd_name, func, executor=executor)
             print(f"Registered command: {cmd_name}")
             return self.commands[cmd_name]
         return decorator
@@ -85,7 +130,7 @@ async def help_command(ctx, *, command: Optional[str] = None):
     def remove_command(self, name: str):
         """Remove a command by name"""
         if name in self.commands:
-            del self.commands[name]
+            self.command_handler.purge_command(self.commands.pop(name))
             print(f"Removed command: {name}")
 
     def event(self, name):
@@ -96,8 +141,81 @@ async def help_command(ctx, *, command: Optional[str] = None):
             return func
         return decorator
 
-    def get_context(self, channel_id: str, message: Optional[Dict[str, Any]] = None) -> Context:
+    def trigger(self, patterns=None, regex=None, case_sensitive=False, ignore_self=True):
+        """Trigger decorator: calls `func(ctx, match)` for messages containing any of
+        `patterns` (substrings) or matching any of `regex`.
+
+        All triggers are matched together in a single scan per message, before
+        command handling. `match` is the matched keyword or the re.Match."""
+        keywords = [patterns] if isinstance(patterns, str) else list(patterns or [])
+        regexes = [regex] if isinstance(regex, str) else list(regex or [])
+        if not keywords and not regexes:
+            raise ValueError("A trigger needs at least one pattern or regex")
+
+        def decorator(func):
+            self.triggers.add(Trigger(func, keywords, regexes, case_sensitive, ignore_self))
+            print(f"Registered trigger: {func.__name__}")
+            return func
+        return decorator
+
+    def remove_trigger(self, func):
+        """Remove all triggers registered for func"""
+        self.triggers.remove(func)
+
+    async def _run_triggers(self, message):
+        content = message.get("content")
+        if not content:
+            return
+        matches = self.triggers.match(content)
+        if not matches:
+            return
+        is_self = parse_snowflake(message.get("author", {}).get("id")) == self.user_id
+        ctx = None
+        for trigger, match in matches:
+            if trigger.ignore_self and is_self:
+                continue
+            if ctx is None:
+                ctx = self.get_context(message.get("channel_id"), message)
+            try:
+                await trigger.callback(ctx, match)
+            except Exception as e:
+                print(f"Error in trigger {trigger.callback.__name__}: {e}")
+
+    def loop(self, seconds=None, cron=None, count=None, jitter=0.0):
+        """Background task decorator: runs the coroutine every `seconds` or on a
+        five-field `cron` schedule once its Loop is started with .start().
+
+        All loops share the bot's timer wheel; see tasks.Loop for stop(),
+        restart(), error handlers and drift stats."""
+        def decorator(func):
+            task = Loop(func, self.timer_wheel, seconds=seconds, cron=cron, count=count, jitter=jitter)
+            self.loops.append(task)
+            print(f"Registered loop: {func.__name__}")
+            return task
+        return decorator
+
+    def load_extension(self, name: str, package: Optional[str] = None):
+        """Imports an extension module and calls its setup(bot); see extensions.ExtensionManager"""
+        self.extensions.load(name, package)
+
+    def unload_extension(self, name: str, package: Optional[str] = None):
+        """Removes the commands, events, triggers, loops and IPC handlers an extension registered"""
+        self.extensions.unload(name, package)
+
+    def reload_extension(self, name: str, package: Optional[str] = None):
+        """Re-imports an extension in place without touching the gateway connection"""
+        self.extensions.reload(name, package)
+
+    def ipc_handler(self, name):
+        """Decorator for a cross-shard query handler, called via ShardManager/bot.ipc.query(name, ...)"""
+        def decorator(func):
+            self.ipc_handlers[name] = func
+            return func
+        return decorator
+
+    def get_context(self, channel_id: SnowflakeLike, message: Optional[Dict[str, Any]] = None) -> Context:
         """Get or create a context for a channel"""
+        channel_id = parse_snowflake(channel_id)
         if channel_id in self._context_cache:
             ctx = self._context_cache[channel_id]
             if message:
@@ -119,13 +237,19 @@ async def help_command(ctx, *, command: Optional[str] = None):
 
         if event_type in self.events:
             print(f"Calling event handler for: {event_type}")
-            await self.events[event_type](event_data)
+            if self.watchdog is None:
+                await self.events[event_type](event_data)
+            else:
+                async with self.watchdog.watch(f"event {event_type}"):
+                    await self.events[event_type](event_data)
 
         if event_type == "MESSAGE_CREATE":
             print("Processing MESSAGE_CREATE event")
+            if self.triggers:
+                await self._run_triggers(event_data)
             await self.on_message(event_data)
 
-    async def handle_message(self, content: str, channel_id: str):
+    async def handle_message(self, content: str, channel_id: Snowflake):
         """Handles incoming messages and checks if they're commands"""
         try:
             print(f"Handling message: {content}")
@@ -143,13 +267,13 @@ async def help_command(ctx, *, command: Optional[str] = None):
                 print("Received invalid message format")
                 return
 
-            author_id = str(message.get("author", {}).get("id"))
-            if author_id != str(self.user_id):
+            author_id = parse_snowflake(message.get("author", {}).get("id"))
+            if author_id != self.user_id:
                 return
 
             print("Message is from selfbot, processing...")
             content = message.get("content", "")
-            channel_id = message.get("channel_id")
+            channel_id = parse_snowflake(message.get("channel_id"))
             if not channel_id:
                 print("No channel_id in message")
                 return
@@ -160,44 +284,160 @@ async def help_command(ctx, *, command: Optional[str] = None):
         except Exception as e:
             print(f"Error in on_message: {e}")
 
-    async def connect(self):
-        """Connect to Discord's gateway"""
+    async def connect(self, shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None, identify_gate=None):
+        """Connect to Discord's gateway, with one connection per shard when shard_ids is given"""
         try:
             print("Starting gateway connection...")
             if not self.token:
                 raise ValueError("No token provided")
-            gateway = GatewayClient(self.token, self)
-            await gateway.connect()
+            from .gateway import GatewayClient
+            if shard_ids is None:
+                self.shards = {None: GatewayClient(self.token, self, recorder=self.gateway_recorder)}
+            else:
+                if not self.is_bot:
+                    raise ValueError("Sharding is only available with is_bot=True")
+                self.shards = {
+                    shard_id: GatewayClient(self.token, self, (shard_id, shard_count), identify_gate, self.gateway_recorder)
+                    for shard_id in shard_ids
+                }
+                print(f"Starting shards {list(shard_ids)} of {shard_count}")
+            for shard_id, gateway in self.shards.items():
+                info = self._saved_sessions.pop(shard_id, None)
+                if info:
+                    gateway.restore_session(info)
+            await asyncio.gather(*(gateway.connect() for gateway in self.shards.values()))
         except Exception as e:
             print(f"Error connecting to gateway: {e}")
             raise
 
-    def run(self, token):
-        """Runs the bot"""
+    async def start(self, token, shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None, identify_gate=None):
+        """Connects to the gateway and runs until close() is called.
+
+        Use this instead of run() to embed the bot in an existing event loop.
+        Sharding arguments are passed through to connect(); see ShardManager
+        for running shards across processes."""
+        if not token:
+            raise ValueError("No token provided")
+        if self._closed:
+            raise RuntimeError("Bot is closed; create a new Bot to connect again")
+        if self._gateway_task is not None:
+            raise RuntimeError("Bot is already running")
+        print("Starting bot...")
+        self.token = token
+        if self.state_store is not None:
+            await self._load_snapshot()
+        self._gateway_task = asyncio.create_task(self.connect(shard_ids, shard_count, identify_gate))
         try:
-            print("Starting bot...")
-            if not token:
-                raise ValueError("No token provided")
-            self.token = token
-            asyncio.run(self.connect())
+            await self._gateway_task
+        except asyncio.CancelledError:
+            if not self._closed:
+                raise
+        finally:
+            self._gateway_task = None
+
+    async def _load_snapshot(self):
+        """Warm-starts bot.state, user_id and the shards' gateway sessions from the state store.
+
+        The snapshot is only used if it was saved for the same token; the
+        restored sessions are RESUMEd on connect instead of IDENTIFYing."""
+        try:
+            session = await self.state_store.load(self.state)
+        except Exception as e:
+            print(f"Error loading state snapshot: {e}")
+            session = None
+        if session is not None and session.get("token_fingerprint") != _token_fingerprint(self.token):
+            # Another account's cache and user ID must not be trusted for this one
+            print("Ignoring state snapshot saved for a different token")
+            self.state.clear()
+            session = None
+        if session is not None:
+            if self.user_id is None:
+                self.user_id = session.get("user_id")
+            self._saved_sessions = {shard_id: info for shard_id, info in session.get("shards", [])}
+            print(f"Loaded state snapshot: {len(self.state.guilds)} guilds, {len(self.state.channels)} channels, {len(self.state.users)} users")
+        if self.state_store.interval:
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.state_store.interval)
+            await self.save_snapshot()
+
+    async def save_snapshot(self):
+        """Writes bot.state and gateway session data to the state store"""
+        if self.state_store is None:
+            return
+        session = {
+            "token_fingerprint": _token_fingerprint(self.token) if self.token else None,
+            "user_id": self.user_id,
+            "shards": [[shard_id, gateway.session_info] for shard_id, gateway in self.shards.items()],
+        }
+        try:
+            await self.state_store.save(self.state, session)
+        except Exception as e:
+            print(f"Error saving state snapshot: {e}")
+
+    async def close(self, timeout: Optional[float] = 10.0):
+        """Stops the gateway connection, waits up to `timeout` seconds for queued
+        sends to go out and closes the HTTP session. A closed bot can't be started again."""
+        # Shutdown runs in its own task: close() is often called from a command
+        # or loop running under the gateway task it has to cancel and await
+        if self._close_task is None:
+            self._closed = True
+            self._close_task = asyncio.create_task(self._shutdown(timeout))
+        await asyncio.shield(self._close_task)
+
+    async def _shutdown(self, timeout: Optional[float]):
+        print("Bot shutting down...")
+        if self._gateway_task is not None and not self._gateway_task.done():
+            self._gateway_task.cancel()
+            try:
+                await self._gateway_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                print(f"Error stopping gateway: {e}")
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+        if self.state_store is not None:
+            await self.save_snapshot()
+            await self.state_store.close()
+        for task in self.loops:
+            task.cancel()
+        self.timer_wheel.stop()
+        await self._message_queue.close(timeout)
+        self.executor.shutdown(wait=False)
+        if self.gateway_recorder is not None:
+            self.gateway_recorder.close()
+        try:
+            await self.session.aclose()
+        except Exception as e:
+            print(f"Error closing session: {e}")
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def run(self, token, use_uvloop: bool = False):
+        """Runs the bot in a new event loop, blocking until it stops.
+
+        Pass use_uvloop=True to run on uvloop (requires the uvloop package)."""
+        async def runner():
+            async with self:
+                await self.start(token)
+
+        try:
+            if use_uvloop:
+                install_uvloop()
+            asyncio.run(runner())
         except KeyboardInterrupt:
             print("\nBot shutting down...")
         except Exception as e:
             print(f"Error running bot: {e}")
-        finally:
-            if hasattr(self, 'session'):
-                try:
-                    asyncio.run(self.session.aclose())
-                except Exception as e:
-                    print(f"Error closing session: {e}")
-
-    @self.command()
-    async def spam(ctx, text: str, count: int = 0, delay: float = 2.0):
-        """
-        Spam a message in the channel.
-        Usage:
-          !spam <text>            
-          !spam <text> <count>    
-          !spam <text> <count> <delay>  
-        """
-        await ctx.spam(text, count=count, delay=delay)
@@ -2,7 +2,6 @@
 # Copyright (c) 2025 JinxedUp
 
 import inspect
-import asyncio
 from typing import Any, Callable, Dict, List, Optional, Union
 from .exceptions import (
     DiscordError,
@@ -49,6 +48,17 @@ class Command:
         self.callback = callback
         self.aliases = kwargs.get('aliases', [])
         self.help = kwargs.get('help', None)
+        # Sync callbacks can't run on the event loop, so they default to the thread pool
+        self.executor = kwargs.get('executor') or (None if inspect.iscoroutinefunction(callback) else 'thread')
+        if self.executor:
+            # Imported here so `from beehive import Command` doesn't load asyncio
+            from .executors import CommandExecutor
+            CommandExecutor.check_callable(self.executor, callback)
+            if 'ctx' in inspect.signature(callback).parameters:
+                raise ValueError(
+                    f"Command callback {callback.__name__} runs in a {self.executor} pool and receives only its "
+                    f"arguments; remove the ctx parameter and return the reply instead, or make it async"
+                )
         self._signature = self._parse_signature(callback)
         self._error_handler = None
 
@@ -78,6 +88,13 @@ class Command:
 
     async def invoke(self, ctx, *args, **kwargs) -> Any:
         """Invoke the command with the given context and arguments"""
+        watchdog = ctx.bot.watchdog
+        if watchdog is None:
+            return await self._invoke(ctx, **kwargs)
+        async with watchdog.watch(f"command {self.name}"):
+            return await self._invoke(ctx, **kwargs)
+
+    async def _invoke(self, ctx, **kwargs) -> Any:
         try:
             # Check for required arguments
             for name, param in self._signature.items():
@@ -95,13 +112,30 @@ class Command:
                         raise BadArgument(name, str(value), param['type'])
                         
             # Call the command
-            return await self.callback(ctx, **converted_kwargs)
+            if not self.executor:
+                return await self.callback(ctx, **converted_kwargs)
+
+            result = await ctx.bot.executor.run(self.executor, self.callback, converted_kwargs)
+            await self._send_result(ctx, result)
+            return result
             
         except CommandError:
             raise
         except Exception as e:
             raise CommandInvokeError(e)
 
+    async def _send_result(self, ctx, result: Any) -> None:
+        """Send the return value of an executor callback through the context"""
+        from .files import File
+        if result is None:
+            return
+        if isinstance(result, File):
+            await ctx.send(files=[result])
+        elif isinstance(result, (list, tuple)) and result and all(isinstance(f, File) for f in result):
+            await ctx.send(files=list(result))
+        else:
+            await ctx.send(str(result))
+
     @property
     def help_str(self) -> str:
         """Get a help string for this command"""
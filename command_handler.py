@@ -3,6 +3,7 @@
 import re
 from typing import Dict, List, Optional, Tuple, Union
 from .command import Command, CommandError, MissingRequiredArgument, BadArgument, CommandNotFound, CommandInvokeError
+from .snowflake import Snowflake
 
 class CommandHandler:
     def __init__(self, bot):
@@ -61,7 +62,41 @@ class CommandHandler:
                 self._command_cache[alias] = cmd
         return cmd
 
-    async def handle_command(self, content: str, channel_id: str) -> None:
+    def purge_command(self, command: Command) -> None:
+        """Drops every cache entry (name or alias) pointing at command"""
+        for key in [key for key, cached in self._command_cache.items() if cached is command]:
+            del self._command_cache[key]
+
+    def _convert_args(self, command: Command, args: List[str]) -> Dict[str, object]:
+        """Converts positional string arguments to the command's parameter types"""
+        kwargs = {}
+        for i, (name, param) in enumerate(command._signature.items()):
+            if i < len(args):
+                arg_value = args[i]
+                if not arg_value:  
+                    continue
+
+                if hasattr(param['type'], '__origin__'):
+                    if param['type'].__origin__ is Union:
+
+                        actual_type = param['type'].__args__[0]
+                        try:
+                            kwargs[name] = actual_type(arg_value)
+                        except (ValueError, TypeError):
+                            raise BadArgument(name, arg_value, actual_type)
+                    else:
+                        kwargs[name] = arg_value
+                else:
+                    try:
+                        kwargs[name] = param['type'](arg_value)
+                    except (ValueError, TypeError):
+                        raise BadArgument(name, arg_value, param['type'])
+            elif not param['required']:
+
+                kwargs[name] = param['default']
+        return kwargs
+
+    async def handle_command(self, content: str, channel_id: Snowflake) -> None:
        
         try:
 
@@ -75,32 +110,7 @@ class CommandHandler:
 
             ctx = self.bot.get_context(channel_id)
 
-            kwargs = {}
-            for i, (name, param) in enumerate(command._signature.items()):
-                if i < len(args):
-                    arg_value = args[i]
-                    if not arg_value:  
-                        continue
-
-                    if hasattr(param['type'], '__origin__'):
-                        if param['type'].__origin__ is Union:
-
-                            actual_type = param['type'].__args__[0]
-                            try:
-                                kwargs[name] = actual_type(arg_value)
-                            except (ValueError, TypeError):
-                                raise BadArgument(name, arg_value, actual_type)
-                        else:
-                            kwargs[name] = arg_value
-                    else:
-                        try:
-                            kwargs[name] = param['type'](arg_value)
-                        except (ValueError, TypeError):
-                            raise BadArgument(name, arg_value, param['type'])
-                elif not param['required']:
-
-                    kwargs[name] = param['default']
-
+            kwargs = self._convert_args(command, args)
             await command.invoke(ctx, **kwargs)
 
         except CommandError as e:
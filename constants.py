@@ -35,3 +35,6 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Linux; Android 15; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Mobile Safari/537.36"
 ]
+
+# Discord epoch (2015-01-01T00:00:00Z) in milliseconds, used by snowflake IDs
+DISCORD_EPOCH = 1420070400000
@@ -3,16 +3,19 @@
 
 import asyncio
 import random
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from .exceptions import DiscordError, RateLimitError, PermissionError, HTTPError, NotFoundError, ForbiddenError
+from .files import File, FileSource, MultipartUpload
+from .snowflake import Snowflake, SnowflakeLike, parse_snowflake
 
 class Message:
     def __init__(self, data: Dict[str, Any]):
-        self.id = data.get('id')
+        self.id: Optional[Snowflake] = parse_snowflake(data.get('id'))
         self.content = data.get('content', '')
         self.author = data.get('author', {})
-        self.channel_id = data.get('channel_id')
-        self.guild_id = data.get('guild_id')
+        self.author_id: Optional[Snowflake] = parse_snowflake(self.author.get('id'))
+        self.channel_id: Optional[Snowflake] = parse_snowflake(data.get('channel_id'))
+        self.guild_id: Optional[Snowflake] = parse_snowflake(data.get('guild_id'))
         self.timestamp = data.get('timestamp')
         self.edited_timestamp = data.get('edited_timestamp')
         self.attachments = data.get('attachments', [])
@@ -21,9 +24,9 @@ class Message:
         self.raw_data = data
 
 class Context:
-    def __init__(self, bot, channel_id: str, message: Optional[Dict[str, Any]] = None):
+    def __init__(self, bot, channel_id: SnowflakeLike, message: Optional[Dict[str, Any]] = None):
         self.bot = bot
-        self.channel_id = channel_id
+        self.channel_id: Snowflake = parse_snowflake(channel_id)
         self.message = Message(message) if message else None
         self._guild = None
         self._channel = None
@@ -33,14 +36,31 @@ class Context:
             "Content-Type": "application/json"
         }
 
-    async def send(self, content: str) -> Message:
-        """Send a message to the channel"""
+    async def send(self, content: Optional[str] = None, files: Optional[List[Union[File, FileSource]]] = None) -> Message:
+        """Send a message to the channel, in order with other sends queued for it.
+
+        `files` may hold File objects or anything File accepts (paths, file
+        objects, buffers); they are streamed as a multipart upload."""
         try:
-            response = await self.bot.session.post(
-                f"https://discord.com/api/v9/channels/{self.channel_id}/messages",
-                headers=self._headers,
-                json={"content": content}
-            )
+            url = f"https://discord.com/api/v9/channels/{self.channel_id}/messages"
+            upload = None
+            if files:
+                upload = MultipartUpload(
+                    {"content": content} if content else {},
+                    [f if isinstance(f, File) else File(f) for f in files]
+                )
+                factory = lambda: self.bot.session.post(url, headers={**self._headers, **upload.headers}, content=upload.stream())
+            else:
+                factory = lambda: self.bot.session.post(url, headers=self._headers, json={"content": content})
+
+            response = await self.bot._message_queue.submit(self.channel_id, "POST", factory)
+
+            if upload is not None:
+                stats = self.bot.upload_stats
+                stats["uploads"] += 1
+                stats["bytes"] += upload.bytes_sent
+                stats["seconds"] += upload.elapsed
+                print(f"Uploaded {len(upload.files)} file(s), {upload.bytes_sent} bytes in {upload.elapsed:.2f}s ({upload.throughput / 1024:.1f} KiB/s)")
 
             if response.status_code == 429:  
                 retry_after = float(response.headers.get('Retry-After', 1))
@@ -58,13 +78,18 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def edit(self, message_id: str, content: str) -> Message:
-        """Edit a message"""
+    async def edit(self, message_id: SnowflakeLike, content: str) -> Message:
+        """Edit a message. Edits still queued for the same message collapse into the latest content"""
         try:
-            response = await self.bot.session.patch(
-                f"https://discord.com/api/v9/channels/{self.channel_id}/messages/{message_id}",
-                headers=self._headers,
-                json={"content": content}
+            response = await self.bot._message_queue.submit(
+                self.channel_id,
+                "PATCH",
+                lambda: self.bot.session.patch(
+                    f"https://discord.com/api/v9/channels/{self.channel_id}/messages/{message_id}",
+                    headers=self._headers,
+                    json={"content": content}
+                ),
+                coalesce_key=parse_snowflake(message_id)
             )
 
             if response.status_code == 429:
@@ -83,7 +108,7 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def delete(self, message_id: str) -> None:
+    async def delete(self, message_id: SnowflakeLike) -> None:
         """Delete a message"""
         try:
             response = await self.bot.session.delete(
@@ -105,13 +130,13 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def bulk_delete(self, message_ids: List[str]) -> None:
+    async def bulk_delete(self, message_ids: List[SnowflakeLike]) -> None:
         """Bulk delete messages"""
         try:
             response = await self.bot.session.post(
                 f"https://discord.com/api/v9/channels/{self.channel_id}/messages/bulk-delete",
                 headers=self._headers,
-                json={"messages": message_ids}
+                json={"messages": [str(message_id) for message_id in message_ids]}
             )
 
             if response.status_code == 429:
@@ -128,7 +153,7 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def add_reaction(self, message_id: str, emoji: str) -> None:
+    async def add_reaction(self, message_id: SnowflakeLike, emoji: str) -> None:
         """Add a reaction to a message"""
         try:
 
@@ -152,7 +177,7 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def remove_reaction(self, message_id: str, emoji: str) -> None:
+    async def remove_reaction(self, message_id: SnowflakeLike, emoji: str) -> None:
         """Remove a reaction from a message"""
         try:
             encoded_emoji = emoji.encode('utf-8').hex()
@@ -175,7 +200,7 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def get_reactions(self, message_id: str, emoji: str) -> List[Dict[str, Any]]:
+    async def get_reactions(self, message_id: SnowflakeLike, emoji: str) -> List[Dict[str, Any]]:
         """Get users who reacted with an emoji"""
         try:
             encoded_emoji = emoji.encode('utf-8').hex()
@@ -251,7 +276,7 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def get_user_info(self, user_id: str) -> Dict[str, Any]:
+    async def get_user_info(self, user_id: SnowflakeLike) -> Dict[str, Any]:
         """Get information about a user"""
         try:
             response = await self.bot.session.get(
@@ -273,7 +298,7 @@ class Context:
                 raise HTTPError(0, str(e))
             raise
 
-    async def get_message_history(self, limit: int = 50, before: Optional[str] = None) -> List[Message]:
+    async def get_message_history(self, limit: int = 50, before: Optional[SnowflakeLike] = None) -> List[Message]:
         """Get message history for the channel"""
         try:
             params = {"limit": limit}
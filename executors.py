@@ -0,0 +1,84 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import importlib
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+EXECUTOR_MODES = ("thread", "process")
+
+def _resolve(module: str, qualname: str) -> Callable:
+    obj = importlib.import_module(module)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    # The name may be bound to the Command the decorator returned
+    return getattr(obj, "callback", obj)
+
+def _run_timed(func: Callable, kwargs: Dict[str, Any], submitted_at: float) -> Tuple[float, float, Any]:
+    started_at = time.time()
+    result = func(**kwargs)
+    return started_at - submitted_at, time.time() - started_at, result
+
+def _run_by_reference(module: str, qualname: str, kwargs: Dict[str, Any], submitted_at: float) -> Tuple[float, float, Any]:
+    return _run_timed(_resolve(module, qualname), kwargs, submitted_at)
+
+class CommandExecutor:
+    """Runs sync command callbacks in thread or process pools, tracking queue wait and run time"""
+
+    def __init__(self, thread_workers: Optional[int] = None, process_workers: Optional[int] = None):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self._pools: Dict[str, Executor] = {}
+        self.stats = {
+            mode: {"tasks": 0, "queue_wait_total": 0.0, "queue_wait_max": 0.0, "run_total": 0.0}
+            for mode in EXECUTOR_MODES
+        }
+
+    @staticmethod
+    def check_callable(mode: str, func: Callable) -> None:
+        """Raises ValueError if `func` can't run under `mode`"""
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor {mode!r}, expected one of {', '.join(EXECUTOR_MODES)}")
+        if asyncio.iscoroutinefunction(func):
+            raise ValueError(f"Command callback {func.__name__} must be a regular function to run in a {mode} pool")
+        if mode == "process" and "<locals>" in func.__qualname__:
+            raise ValueError(f"Command callback {func.__qualname__} must be defined at module level to run in a process pool")
+
+    def _get_pool(self, mode: str) -> Executor:
+        pool = self._pools.get(mode)
+        if pool is None:
+            if mode == "thread":
+                pool = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="beehive-command")
+            else:
+                pool = ProcessPoolExecutor(max_workers=self.process_workers)
+            self._pools[mode] = pool
+        return pool
+
+    async def run(self, mode: str, func: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Runs func(**kwargs) in the `mode` pool and returns its result"""
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        if mode == "process":
+            job = loop.run_in_executor(self._get_pool(mode), _run_by_reference, func.__module__, func.__qualname__, kwargs, submitted_at)
+        else:
+            job = loop.run_in_executor(self._get_pool(mode), _run_timed, func, kwargs, submitted_at)
+        queue_wait, run_time, result = await job
+
+        stats = self.stats[mode]
+        stats["tasks"] += 1
+        stats["queue_wait_total"] += queue_wait
+        stats["queue_wait_max"] = max(stats["queue_wait_max"], queue_wait)
+        stats["run_total"] += run_time
+        return result
+
+    def recycle(self, mode: str) -> None:
+        """Drops the `mode` pool so the next job starts fresh workers; submitted jobs finish on the old one"""
+        pool = self._pools.pop(mode, None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+        self._pools.clear()
@@ -0,0 +1,196 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+class ExtensionError(Exception):
+    """Base exception for extension loading errors"""
+    def __init__(self, name: str, message: Optional[str] = None):
+        self.name = name
+        super().__init__(message or f"Extension '{name}' failed")
+
+class ExtensionAlreadyLoaded(ExtensionError):
+    """Raised when loading an extension that is already loaded"""
+    def __init__(self, name: str):
+        super().__init__(name, f"Extension '{name}' is already loaded")
+
+class ExtensionNotLoaded(ExtensionError):
+    """Raised when unloading or reloading an extension that isn't loaded"""
+    def __init__(self, name: str):
+        super().__init__(name, f"Extension '{name}' is not loaded")
+
+class NoEntryPointError(ExtensionError):
+    """Raised when an extension module has no setup(bot) function"""
+    def __init__(self, name: str):
+        super().__init__(name, f"Extension '{name}' has no setup function")
+
+class ExtensionFailed(ExtensionError):
+    """Raised when an extension fails to import, set up or tear down"""
+    def __init__(self, name: str, original: Exception):
+        self.original = original
+        super().__init__(name, f"Extension '{name}' raised an error: {type(original).__name__}: {original}")
+
+class _Registrations:
+    """What one extension added to the bot, plus the entries it replaced"""
+
+    def __init__(self):
+        self.commands: Dict[str, Any] = {}
+        self.replaced_commands: Dict[str, Any] = {}
+        self.events: Dict[str, Callable] = {}
+        self.replaced_events: Dict[str, Callable] = {}
+        self.ipc_handlers: Dict[str, Callable] = {}
+        self.replaced_ipc_handlers: Dict[str, Callable] = {}
+        self.triggers: List[Any] = []
+        self.loops: List[Any] = []
+
+def _diff(before: Dict[str, Any], after: Dict[str, Any], added: Dict[str, Any], replaced: Dict[str, Any]) -> None:
+    for key, value in after.items():
+        previous = before.get(key)
+        if previous is not value:
+            added[key] = value
+            if previous is not None:
+                replaced[key] = previous
+
+def _restore(current: Dict[str, Any], added: Dict[str, Any], replaced: Dict[str, Any]) -> List[Any]:
+    """Removes `added` entries still present in `current`, putting back what they replaced"""
+    removed = []
+    for key, value in added.items():
+        if current.get(key) is not value:
+            # Overridden since by someone else; leave theirs in place
+            continue
+        removed.append(value)
+        if key in replaced:
+            current[key] = replaced[key]
+        else:
+            del current[key]
+    return removed
+
+class ExtensionManager:
+    """Loads, unloads and reloads extension modules (a `setup(bot)` and optional `teardown(bot)`) on a running bot"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.modules: Dict[str, ModuleType] = {}
+        self._registrations: Dict[str, _Registrations] = {}
+
+    # Diffing the bot's registries around setup() tells us exactly what an
+    # extension added, so unloading can remove only that and restore anything it shadowed
+    def _snapshot(self):
+        bot = self.bot
+        return (
+            dict(bot.commands),
+            dict(bot.events),
+            dict(bot.ipc_handlers),
+            {id(t) for t in bot.triggers.triggers},
+            {id(task) for task in bot.loops},
+        )
+
+    def _collect(self, before) -> _Registrations:
+        bot = self.bot
+        commands, events, ipc_handlers, triggers, loops = before
+        registrations = _Registrations()
+        _diff(commands, bot.commands, registrations.commands, registrations.replaced_commands)
+        _diff(events, bot.events, registrations.events, registrations.replaced_events)
+        _diff(ipc_handlers, bot.ipc_handlers, registrations.ipc_handlers, registrations.replaced_ipc_handlers)
+        registrations.triggers = [t for t in bot.triggers.triggers if id(t) not in triggers]
+        registrations.loops = [task for task in bot.loops if id(task) not in loops]
+        # Replaced commands may still be cached under their names and aliases
+        for command in registrations.replaced_commands.values():
+            bot.command_handler.purge_command(command)
+        return registrations
+
+    def _remove(self, registrations: _Registrations) -> None:
+        bot = self.bot
+        for task in registrations.loops:
+            task.cancel()
+        loops = {id(task) for task in registrations.loops}
+        bot.loops[:] = [task for task in bot.loops if id(task) not in loops]
+        if registrations.triggers:
+            bot.triggers.remove_triggers(registrations.triggers)
+        for command in _restore(bot.commands, registrations.commands, registrations.replaced_commands):
+            bot.command_handler.purge_command(command)
+        if any(command.executor == "process" for command in registrations.commands.values()):
+            # Pool workers still hold the old module in their sys.modules
+            bot.executor.recycle("process")
+        _restore(bot.events, registrations.events, registrations.replaced_events)
+        _restore(bot.ipc_handlers, registrations.ipc_handlers, registrations.replaced_ipc_handlers)
+
+    @staticmethod
+    def _purge_modules(name: str) -> Dict[str, ModuleType]:
+        removed = {}
+        for module_name in [m for m in sys.modules if m == name or m.startswith(name + ".")]:
+            removed[module_name] = sys.modules.pop(module_name)
+        return removed
+
+    def _setup(self, name: str, module: ModuleType) -> None:
+        setup = getattr(module, "setup", None)
+        if setup is None:
+            raise NoEntryPointError(name)
+        before = self._snapshot()
+        try:
+            setup(self.bot)
+        except Exception as e:
+            # Undo whatever setup registered before failing
+            self._remove(self._collect(before))
+            raise ExtensionFailed(name, e) from e
+        self._registrations[name] = self._collect(before)
+        self.modules[name] = module
+
+    def load(self, name: str, package: Optional[str] = None) -> None:
+        """Imports the module `name` and calls its setup(bot)"""
+        name = importlib.util.resolve_name(name, package)
+        if name in self.modules:
+            raise ExtensionAlreadyLoaded(name)
+        try:
+            module = importlib.import_module(name)
+        except ModuleNotFoundError as e:
+            if e.name == name:
+                raise ExtensionError(name, f"Extension '{name}' could not be found") from e
+            raise ExtensionFailed(name, e) from e
+        except Exception as e:
+            raise ExtensionFailed(name, e) from e
+        try:
+            self._setup(name, module)
+        except ExtensionError:
+            self._purge_modules(name)
+            raise
+        print(f"Loaded extension: {name}")
+
+    def _unload(self, name: str) -> Dict[str, ModuleType]:
+        module = self.modules.pop(name)
+        teardown = getattr(module, "teardown", None)
+        try:
+            if teardown is not None:
+                teardown(self.bot)
+        except Exception as e:
+            print(f"Error in teardown of extension {name}: {e}")
+        finally:
+            self._remove(self._registrations.pop(name))
+        return self._purge_modules(name)
+
+    def unload(self, name: str, package: Optional[str] = None) -> None:
+        """Calls the extension's teardown(bot) and removes everything its setup registered"""
+        name = importlib.util.resolve_name(name, package)
+        if name not in self.modules:
+            raise ExtensionNotLoaded(name)
+        self._unload(name)
+        print(f"Unloaded extension: {name}")
+
+    def reload(self, name: str, package: Optional[str] = None) -> None:
+        """Unloads and re-imports an extension, restoring the previous version if the new one fails"""
+        name = importlib.util.resolve_name(name, package)
+        if name not in self.modules:
+            raise ExtensionNotLoaded(name)
+        old = self.modules[name]
+        old_modules = self._unload(name)
+        try:
+            self.load(name)
+        except ExtensionError:
+            sys.modules.update(old_modules)
+            self._setup(name, old)
+            print(f"Reload of extension {name} failed; previous version restored")
+            raise
+        print(f"Reloaded extension: {name}")
@@ -0,0 +1,175 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import json
+import mmap
+import os
+import time
+import uuid
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Union
+
+FileSource = Union[str, os.PathLike, BinaryIO, bytes, bytearray, memoryview, mmap.mmap]
+
+CHUNK_SIZE = 256 * 1024
+
+class File:
+    """A file to upload with Context.send, from a path, binary file object or buffer"""
+
+    def __init__(self, fp: FileSource, filename: Optional[str] = None, *, spoiler: bool = False, description: Optional[str] = None):
+        self.fp = fp
+        self.description = description
+        self._start = None
+
+        if isinstance(fp, (str, os.PathLike)):
+            self._kind = "path"
+            name = os.path.basename(os.fspath(fp))
+        elif isinstance(fp, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._kind = "buffer"
+            self.fp = memoryview(fp).cast("B")
+            name = None
+        else:
+            self._kind = "file"
+            name = os.path.basename(getattr(fp, "name", "") or "") or None
+            if getattr(fp, "seekable", lambda: False)():
+                self._start = fp.tell()
+
+        filename = filename or name or "file"
+        if spoiler and not filename.startswith("SPOILER_"):
+            filename = f"SPOILER_{filename}"
+        self.filename = filename
+
+    def __getstate__(self):
+        # memoryviews can't be pickled; buffers travel as bytes (e.g. from a process pool)
+        state = self.__dict__.copy()
+        if self._kind == "buffer":
+            state["fp"] = self.fp.tobytes()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._kind == "buffer":
+            self.fp = memoryview(self.fp)
+
+    @property
+    def size(self) -> Optional[int]:
+        """Number of bytes that will be uploaded, or None if it can't be known up front"""
+        if self._kind == "path":
+            return os.path.getsize(self.fp)
+        if self._kind == "buffer":
+            return self.fp.nbytes
+        if self._start is not None:
+            try:
+                return os.fstat(self.fp.fileno()).st_size - self._start
+            except (AttributeError, OSError, ValueError):
+                end = self.fp.seek(0, os.SEEK_END)
+                self.fp.seek(self._start)
+                return end - self._start
+        return None
+
+    async def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[Union[bytes, memoryview]]:
+        """Yields the file's content in chunks, rewinding first so retried requests resend it all"""
+        if self._kind == "buffer":
+            for offset in range(0, self.fp.nbytes, chunk_size):
+                yield self.fp[offset:offset + chunk_size]
+            return
+
+        if self._kind == "path":
+            f = await asyncio.to_thread(open, self.fp, "rb")
+        else:
+            f = self.fp
+            if self._start is not None:
+                f.seek(self._start)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(f.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            if self._kind == "path":
+                f.close()
+
+class MultipartUpload:
+    """Streams a multipart/form-data message body, recording bytes sent and elapsed time"""
+
+    def __init__(self, payload: Dict[str, Any], files: List[File]):
+        self.boundary = uuid.uuid4().hex
+        self.files = files
+        payload = dict(payload)
+        payload["attachments"] = [
+            {"id": i, "filename": f.filename, **({"description": f.description} if f.description else {})}
+            for i, f in enumerate(files)
+        ]
+        self._payload_part = self._part_header('name="payload_json"', "application/json") + json.dumps(payload).encode() + b"\r\n"
+        self._file_headers = [
+            self._part_header(f'name="files[{i}]"; filename="{self._quote(f.filename)}"', "application/octet-stream")
+            for i, f in enumerate(files)
+        ]
+        self._closing = f"--{self.boundary}--\r\n".encode()
+        self.bytes_sent = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "").replace("\n", "")
+
+    def _part_header(self, disposition: str, content_type: str) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f"Content-Disposition: form-data; {disposition}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> Optional[int]:
+        total = len(self._payload_part) + len(self._closing)
+        for header, f in zip(self._file_headers, self.files):
+            size = f.size
+            if size is None:
+                return None
+            total += len(header) + size + 2
+        return total
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        # Without a Content-Length, httpx falls back to chunked transfer encoding
+        headers = {"Content-Type": self.content_type}
+        length = self.content_length
+        if length is not None:
+            headers["Content-Length"] = str(length)
+        return headers
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Average upload rate in bytes per second"""
+        elapsed = self.elapsed
+        return self.bytes_sent / elapsed if elapsed else 0.0
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        self.bytes_sent = 0
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        yield self._emit(self._payload_part)
+        for header, f in zip(self._file_headers, self.files):
+            yield self._emit(header)
+            async for chunk in f.iter_chunks():
+                # Buffer slices are copied one CHUNK_SIZE chunk at a time, never the whole buffer
+                yield self._emit(bytes(chunk) if isinstance(chunk, memoryview) else chunk)
+            yield self._emit(b"\r\n")
+        yield self._emit(self._closing)
+        self.finished_at = time.perf_counter()
+
+    def _emit(self, data: bytes) -> bytes:
+        self.bytes_sent += len(data)
+        return data
@@ -1,78 +1,235 @@
 # MIT License
 # Copyright (c) 2025 JinxedUp
 import json
+import random
 import asyncio
-import httpx
-from httpx_ws import aconnect_ws
+from httpx_ws import aconnect_ws, WebSocketDisconnect
+from .jsonstream import loads_streamed, peek_event_type
+from .snowflake import parse_snowflake
+
+# Frames at least this large are decoded incrementally when they carry READY or GUILD_CREATE
+STREAM_THRESHOLD = 256 * 1024
+
+class _Reconnect(Exception):
+    """Raised from a frame handler to drop the connection and reconnect after `delay` seconds"""
+    def __init__(self, reason, delay=0.0):
+        self.delay = delay
+        super().__init__(reason)
 
 class GatewayClient:
-    def __init__(self, token, handler):
+    def __init__(self, token, handler, shard=None, identify_gate=None, recorder=None):
+        """`shard` is an optional (shard_id, shard_count) pair for bot tokens.
+        `identify_gate` is an optional coroutine function called with the shard
+        ID before each IDENTIFY, used to respect max_concurrency across shards.
+        `recorder` is an optional GatewayRecorder that receives every raw frame."""
         self.token = token
         self.handler = handler
         self.ws_url = "wss://gateway.discord.gg/?v=9&encoding=json"
+        self.shard_id, self.shard_count = shard if shard else (None, None)
+        self.identify_gate = identify_gate
+        self.recorder = recorder
+        self.events_received = 0
+        self.guild_ids = set()
+        self.session_id = None
+        self.sequence = None
+        self.resume_gateway_url = None
+
+    def restore_session(self, info):
+        """Restores session data saved from session_info so the next connect
+        RESUMEs instead of IDENTIFYing. Ignored if it was saved for a
+        different shard count; a stale session falls back to IDENTIFY when
+        the gateway rejects it."""
+        if info.get("shard_count") != self.shard_count or not info.get("session_id") or info.get("sequence") is None:
+            return
+        self.session_id = info["session_id"]
+        self.sequence = info["sequence"]
+        self.resume_gateway_url = info.get("resume_gateway_url")
+
+    def _clear_session(self):
+        self.session_id = None
+        self.sequence = None
+        self.resume_gateway_url = None
 
     async def connect(self):
         print("Connecting to Discord Gateway...")
         while True:
             try:
+                resuming = self.session_id is not None and self.sequence is not None
+                url = self.ws_url
+                if resuming and self.resume_gateway_url:
+                    url = f"{self.resume_gateway_url.rstrip('/')}/?v=9&encoding=json"
 
-                async with aconnect_ws(self.ws_url) as ws:
+                async with aconnect_ws(url) as ws:
                     print("Connected to Gateway, waiting for HELLO...")
                     hello = await ws.receive_json()  
                     interval = hello["d"]["heartbeat_interval"] / 1000  
                     print(f"Received HELLO, heartbeat interval: {interval}s")
 
-                    identify_payload = {
-                        "op": 2,
-                        "d": {
-                            "token": self.token,
-                            "intents": 32767,  
-                            "properties": {
-                                "$os": "windows",
-                                "$browser": "chrome",
-                                "$device": "desktop"
-                            }
-                        }
-                    }
-
-                    print("Sending identify payload...")
-                    await ws.send_json(identify_payload)
+                    if resuming:
+                        print(f"Resuming session {self.session_id} at sequence {self.sequence}...")
+                        await ws.send_json({"op": 6, "d": {"token": self.token, "session_id": self.session_id, "seq": self.sequence}})
+                    else:
+                        await self._identify(ws)
 
                     async def heartbeat():
                         while True:
                             await asyncio.sleep(interval)
-                            await ws.send_json({"op": 1, "d": None})
+                            await ws.send_json({"op": 1, "d": self.sequence})
 
-                    asyncio.create_task(heartbeat())
+                    heartbeat_task = asyncio.create_task(heartbeat())
                     print("Heartbeat task started")
 
-                    while True:
-                        try:
-                            msg = await ws.receive_json()
-                            print(f"Received gateway message: {msg}")  
-
-                            if isinstance(msg, dict) and "op" in msg:
-                                if msg["op"] == 0:  
-                                    event_type = msg.get("t")
-                                    event_data = msg.get("d", {})
-                                    print(f"Processing event: {event_type}")
-
-                                    if event_type == "READY":
-                                        print("Received READY event")
-
-                                        self.handler.user_id = event_data["user"]["id"]
-                                        print(f"Bot user ID set to: {self.handler.user_id}")
-
-                                    event_data["_event_type"] = event_type
-                                    await self.handler.handle(event_data)
-                                elif msg["op"] == 10:  
-                                    print("Received HELLO event")
-                                elif msg["op"] == 11:  
-                                    print("Received heartbeat ACK")
-                        except Exception as e:
-                            print(f"Error processing message: {e}")
-                            continue
+                    try:
+                        await self._receive_loop(ws)
+                    finally:
+                        heartbeat_task.cancel()
 
+            except _Reconnect as e:
+                print(f"Gateway asked to reconnect ({e}), reconnecting in {e.delay:.1f} seconds...")
+                await asyncio.sleep(e.delay)
             except Exception as e:
                 print(f"Gateway error: {e}. Reconnecting in 5 seconds...")
                 await asyncio.sleep(5)
+
+    async def _identify(self, ws):
+        identify_payload = {
+            "op": 2,
+            "d": {
+                "token": self.token,
+                "intents": 32767,  
+                "properties": {
+                    "$os": "windows",
+                    "$browser": "chrome",
+                    "$device": "desktop"
+                }
+            }
+        }
+
+        if self.shard_id is not None:
+            identify_payload["d"]["shard"] = [self.shard_id, self.shard_count]
+        if self.identify_gate is not None:
+            await self.identify_gate(self.shard_id)
+
+        print("Sending identify payload...")
+        await ws.send_json(identify_payload)
+
+    async def _receive_loop(self, ws):
+        """Reads and dispatches frames until the connection drops"""
+        while True:
+            try:
+                raw = await ws.receive_text()
+                if self.recorder is not None:
+                    self.recorder.write(raw)
+                await self.dispatch_frame(raw)
+            except (WebSocketDisconnect, _Reconnect):
+                raise
+            except Exception as e:
+                print(f"Error processing message: {e}")
+                continue
+
+    async def dispatch_frame(self, raw):
+        """Decodes one raw gateway frame and dispatches it to the handler"""
+        state = getattr(self.handler, "state", None)
+        if state is not None and len(raw) >= STREAM_THRESHOLD and peek_event_type(raw) in ("READY", "GUILD_CREATE"):
+            msg = self._decode_streamed(raw, state)
+        else:
+            msg = json.loads(raw)
+            if state is not None and isinstance(msg, dict) and msg.get("t") in ("READY", "GUILD_CREATE"):
+                # Small frames get the same shape as streamed ones, so handlers
+                # don't depend on a size threshold they can't see
+                self._split_items(msg, state)
+        print(f"Received gateway message: {msg}")  
+
+        if isinstance(msg, dict) and "op" in msg:
+            if msg.get("s") is not None:
+                self.sequence = msg["s"]
+            if msg["op"] == 0:  
+                event_type = msg.get("t")
+                event_data = msg.get("d", {})
+                print(f"Processing event: {event_type}")
+                self.events_received += 1
+
+                if event_type == "READY":
+                    print("Received READY event")
+
+                    self.handler.user_id = parse_snowflake(event_data["user"]["id"])
+                    print(f"Bot user ID set to: {self.handler.user_id}")
+                    self.session_id = event_data.get("session_id")
+                    self.resume_gateway_url = event_data.get("resume_gateway_url")
+                    self.guild_ids.update(parse_snowflake(g.get("id")) for g in event_data.get("guilds", []))
+                    if state is not None:
+                        state.add_user(event_data["user"])
+                elif event_type == "GUILD_CREATE":
+                    self.guild_ids.add(parse_snowflake(event_data.get("id")))
+                    if state is not None:
+                        state.ingest_guild(dict(event_data))
+                elif event_type == "GUILD_DELETE" and not event_data.get("unavailable"):
+                    self.guild_ids.discard(parse_snowflake(event_data.get("id")))
+                    if state is not None:
+                        state.remove_guild(event_data.get("id"))
+
+                event_data["_event_type"] = event_type
+                event_data["_shard_id"] = self.shard_id
+                await self.handler.handle(event_data)
+            elif msg["op"] == 7:
+                raise _Reconnect("RECONNECT")
+            elif msg["op"] == 9:
+                if not msg.get("d"):
+                    # Not resumable (e.g. a stale persisted session): IDENTIFY on the next connect
+                    self._clear_session()
+                raise _Reconnect("INVALID_SESSION", random.uniform(1, 5))
+            elif msg["op"] == 10:  
+                print("Received HELLO event")
+            elif msg["op"] == 11:  
+                print("Received heartbeat ACK")
+
+    @staticmethod
+    def _item_sink(state):
+        """Returns an on_item callback feeding ITEM_KEYS elements into `state`,
+        and the list it fills with READY guild stubs"""
+        guild_stubs = []
+
+        def on_item(key, item):
+            if key == "guilds":
+                unavailable = item.get("unavailable", False)
+                guild_id = state.ingest_guild(item)
+                guild_stubs.append({"id": str(guild_id), "unavailable": unavailable})
+            else:
+                state.ingest_item(key, item)
+
+        return on_item, guild_stubs
+
+    def _decode_streamed(self, raw, state):
+        """Decodes a large READY/GUILD_CREATE frame, feeding its ITEM_KEYS arrays
+        into the state cache one element at a time instead of building them whole"""
+        on_item, guild_stubs = self._item_sink(state)
+        msg = loads_streamed(raw, state.ITEM_KEYS, on_item)
+        if msg.get("t") == "READY":
+            msg.setdefault("d", {})["guilds"] = guild_stubs
+        return msg
+
+    def _split_items(self, msg, state):
+        """Moves a decoded READY/GUILD_CREATE's ITEM_KEYS arrays into the state cache, matching _decode_streamed's event shape"""
+        data = msg.get("d")
+        if not isinstance(data, dict):
+            return
+        on_item, guild_stubs = self._item_sink(state)
+        for key in state.ITEM_KEYS:
+            if isinstance(data.get(key), list):
+                for item in data.pop(key):
+                    on_item(key, item)
+        if msg.get("t") == "READY":
+            data["guilds"] = guild_stubs
+
+    @property
+    def session_info(self):
+        return {
+            "session_id": self.session_id,
+            "sequence": self.sequence,
+            "resume_gateway_url": self.resume_gateway_url,
+            "shard_count": self.shard_count,
+        }
+
+    @property
+    def stats(self):
+        return {"events": self.events_received, "guilds": len(self.guild_ids)}
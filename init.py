@@ -1,9 +1,9 @@
 # MIT License
 # Copyright (c) 2025 JinxedUp
 
-from .bot import Bot
+import importlib
+from typing import TYPE_CHECKING
 from .command import Command, CommandError, MissingRequiredArgument, BadArgument, CommandNotFound, CommandInvokeError
-from .context import Context, Message
 from .exceptions import (
     DiscordError,
     RateLimitError,
@@ -12,12 +12,29 @@ from .exceptions import (
     NotFoundError,
     ForbiddenError
 )
+from .snowflake import (
+    Snowflake,
+    parse_snowflake,
+    snowflake_time,
+    snowflake_timestamp,
+    snowflake_worker,
+    snowflake_process,
+    snowflake_increment,
+    snowflake_from_time
+)
 
 __all__ = [
     'Bot',
     'Command',
     'Context',
     'Message',
+    'File',
+    'ShardManager',
+    'GatewayRecorder',
+    'SlowHandlerWatchdog',
+    'StateStore',
+    'Loop',
+    'ExtensionManager',
     
     'CommandError',
     'MissingRequiredArgument',
@@ -25,12 +42,77 @@ __all__ = [
     'CommandNotFound',
     'CommandInvokeError',
     
+    'ExtensionError',
+    'ExtensionAlreadyLoaded',
+    'ExtensionNotLoaded',
+    'NoEntryPointError',
+    'ExtensionFailed',
+    
     'DiscordError',
     'RateLimitError',
     'PermissionError',
     'HTTPError',
     'NotFoundError',
-    'ForbiddenError'
+    'ForbiddenError',
+
+    'Snowflake',
+    'parse_snowflake',
+    'snowflake_time',
+    'snowflake_timestamp',
+    'snowflake_worker',
+    'snowflake_process',
+    'snowflake_increment',
+    'snowflake_from_time'
 ]
 
 __version__ = '0.1.0'
+
+# Modules that pull in heavy dependencies (httpx, httpx_ws, asyncio) are
+# imported on first attribute access so scripts that only need commands,
+# exceptions or snowflake helpers start fast.
+_LAZY_ATTRS = {
+    'Bot': '.bot',
+    'Context': '.context',
+    'Message': '.context',
+    'File': '.files',
+    'ShardManager': '.sharding',
+    'GatewayRecorder': '.replay',
+    'SlowHandlerWatchdog': '.watchdog',
+    'StateStore': '.persistence',
+    'Loop': '.tasks',
+    'ExtensionManager': '.extensions',
+    'ExtensionError': '.extensions',
+    'ExtensionAlreadyLoaded': '.extensions',
+    'ExtensionNotLoaded': '.extensions',
+    'NoEntryPointError': '.extensions',
+    'ExtensionFailed': '.extensions',
+}
+
+if TYPE_CHECKING:
+    from .bot import Bot
+    from .context import Context, Message
+    from .files import File
+    from .sharding import ShardManager
+    from .replay import GatewayRecorder
+    from .watchdog import SlowHandlerWatchdog
+    from .persistence import StateStore
+    from .tasks import Loop
+    from .extensions import (
+        ExtensionManager,
+        ExtensionError,
+        ExtensionAlreadyLoaded,
+        ExtensionNotLoaded,
+        NoEntryPointError,
+        ExtensionFailed
+    )
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
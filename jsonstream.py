@@ -0,0 +1,83 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import json
+import re
+from typing import Any, Callable, Collection, Dict, Iterator, Optional
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+_event_type = re.compile(r'"t"\s*:\s*"([A-Z_]+)"')
+
+class _Scanner:
+    """Walks a JSON document, decoding one value at a time with raw_decode"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def peek(self) -> str:
+        self.pos = _whitespace.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at position {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        value, self.pos = _decoder.raw_decode(self.text, self.pos)
+        return value
+
+    def members(self) -> Iterator[str]:
+        """Yields object keys; the caller must consume each value before resuming"""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+            else:
+                self.expect("}")
+                return
+
+    def elements(self) -> Iterator[Any]:
+        """Yields decoded array elements one at a time"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+            else:
+                self.expect("]")
+                return
+
+def peek_event_type(raw: str, window: int = 128) -> Optional[str]:
+    """Finds a dispatch frame's top-level "t" by searching only its head and tail"""
+    match = _event_type.search(raw, 0, window) or _event_type.search(raw, max(0, len(raw) - window))
+    return match.group(1) if match else None
+
+def loads_streamed(raw: str, stream_keys: Collection[str], on_item: Callable[[str, Any], None]) -> Dict[str, Any]:
+    """Decodes a gateway frame, passing each element of d[key] for `stream_keys` to on_item(key, element) instead of returning it"""
+    scanner = _Scanner(raw)
+    frame = {}
+    for key in scanner.members():
+        if key == "d" and scanner.peek() == "{":
+            data = {}
+            for data_key in scanner.members():
+                if data_key in stream_keys and scanner.peek() == "[":
+                    for item in scanner.elements():
+                        on_item(data_key, item)
+                else:
+                    data[data_key] = scanner.value()
+            frame["d"] = data
+        else:
+            frame[key] = scanner.value()
+    return frame
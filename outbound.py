@@ -0,0 +1,139 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Tuple
+from .snowflake import Snowflake
+
+RequestFactory = Callable[[], Awaitable[Any]]
+
+class _RateLimitBucket:
+    """Tracks the X-RateLimit-* state Discord reports for one route"""
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+
+    async def wait(self) -> None:
+        if self.remaining == 0:
+            delay = self.reset_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.remaining = None
+
+    def update(self, headers) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset_after is not None:
+            self.reset_at = time.monotonic() + float(reset_after)
+
+class _Job:
+    __slots__ = ("bucket", "factory", "coalesce_key", "future")
+
+    def __init__(self, bucket: Tuple[str, Snowflake], factory: RequestFactory, coalesce_key: Optional[Hashable], future: asyncio.Future):
+        self.bucket = bucket
+        self.factory = factory
+        self.coalesce_key = coalesce_key
+        self.future = future
+
+class OutboundQueue:
+    """Per-channel ordered queue for outgoing requests; queued edits with the same coalesce_key collapse into one"""
+
+    def __init__(self, max_retries: int = 3):
+        self.max_retries = max_retries
+        self._channels: Dict[Snowflake, Deque[_Job]] = {}
+        self._workers: Dict[Snowflake, asyncio.Task] = {}
+        self._pending: Dict[Hashable, _Job] = {}
+        self._buckets: Dict[Tuple[str, Snowflake], _RateLimitBucket] = {}
+        # A global 429 pauses every channel's worker until this time
+        self._global_reset_at = 0.0
+        self.stats = {"submitted": 0, "requests": 0, "coalesced": 0, "rate_limited": 0, "global_rate_limited": 0}
+
+    async def submit(self, channel_id: Snowflake, method: str, factory: RequestFactory, coalesce_key: Optional[Hashable] = None) -> Any:
+        """Queue a request and wait for its response"""
+        self.stats["submitted"] += 1
+        if coalesce_key is not None:
+            job = self._pending.get(coalesce_key)
+            if job is not None:
+                job.factory = factory
+                self.stats["coalesced"] += 1
+                return await asyncio.shield(job.future)
+
+        job = _Job((method, channel_id), factory, coalesce_key, asyncio.get_running_loop().create_future())
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = job
+        self._channels.setdefault(channel_id, deque()).append(job)
+        if channel_id not in self._workers:
+            self._workers[channel_id] = asyncio.create_task(self._drain(channel_id))
+        return await asyncio.shield(job.future)
+
+    async def _drain(self, channel_id: Snowflake) -> None:
+        jobs = self._channels[channel_id]
+        try:
+            while jobs:
+                job = jobs.popleft()
+                if job.coalesce_key is not None:
+                    self._pending.pop(job.coalesce_key, None)
+                try:
+                    result = await self._perform(job)
+                except asyncio.CancelledError:
+                    job.future.cancel()
+                    raise
+                except Exception as e:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                else:
+                    if not job.future.done():
+                        job.future.set_result(result)
+        finally:
+            del self._workers[channel_id]
+            if not jobs:
+                del self._channels[channel_id]
+
+    async def _perform(self, job: _Job) -> Any:
+        bucket = self._buckets.setdefault(job.bucket, _RateLimitBucket())
+        for attempt in range(self.max_retries + 1):
+            await self._wait_global()
+            await bucket.wait()
+            self.stats["requests"] += 1
+            response = await job.factory()
+            bucket.update(response.headers)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            self.stats["rate_limited"] += 1
+            retry_after = float(response.headers.get("Retry-After", 1))
+            if response.headers.get("X-RateLimit-Global", "").lower() == "true" or response.headers.get("X-RateLimit-Scope") == "global":
+                self.stats["global_rate_limited"] += 1
+                self._global_reset_at = max(self._global_reset_at, time.monotonic() + retry_after)
+                print(f"Globally rate limited, pausing all channels for {retry_after}s")
+                continue
+            print(f"Rate limited on {job.bucket[0]} {job.bucket[1]}, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+        return response
+
+    async def _wait_global(self) -> None:
+        # Loops because another worker may extend the pause while this one sleeps
+        while True:
+            delay = self._global_reset_at - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Wait up to `timeout` seconds for queued requests to be sent, then
+        cancel the remaining workers, failing any requests still queued"""
+        workers = list(self._workers.values())
+        if workers and timeout:
+            _, workers = await asyncio.wait(workers, timeout=timeout)
+            if workers:
+                print(f"Outbound queue still busy after {timeout}s, dropping {sum(len(jobs) for jobs in self._channels.values())} queued requests")
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for jobs in self._channels.values():
+            for job in jobs:
+                job.future.cancel()
+        self._channels.clear()
+        self._pending.clear()
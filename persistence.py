@@ -0,0 +1,76 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from .state import ConnectionState
+
+_TABLES = ("guilds", "channels", "users")
+
+class StateStore:
+    """Snapshots bot.state and session data to SQLite for warm starts; set `bot.state_store = StateStore(...)`"""
+
+    def __init__(self, path: str = "beehive_state.db", interval: Optional[float] = 300.0):
+        self.path = path
+        self.interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="beehive-store")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for table in _TABLES:
+                self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, data TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS session (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.commit()
+        return self._conn
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _write(self, entities: Dict[str, List[Tuple[int, Dict[str, Any]]]], session: Dict[str, Any]) -> None:
+        conn = self._connect()
+        with conn:
+            for table, rows in entities.items():
+                conn.execute(f"DELETE FROM {table}")
+                conn.executemany(
+                    f"INSERT INTO {table} (id, data) VALUES (?, ?)",
+                    ((entity_id, json.dumps(data)) for entity_id, data in rows)
+                )
+            conn.execute("DELETE FROM session")
+            conn.executemany(
+                "INSERT INTO session (key, value) VALUES (?, ?)",
+                ((key, json.dumps(value)) for key, value in session.items())
+            )
+
+    def _read(self) -> Tuple[Dict[str, Dict[int, Dict[str, Any]]], Dict[str, Any]]:
+        conn = self._connect()
+        entities = {
+            table: {entity_id: json.loads(data) for entity_id, data in conn.execute(f"SELECT id, data FROM {table}")}
+            for table in _TABLES
+        }
+        session = {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM session")}
+        return entities, session
+
+    async def save(self, state: ConnectionState, session: Dict[str, Any]) -> None:
+        """Writes a snapshot of `state` and `session` (JSON-serializable values)"""
+        # Taking the item lists here, on the event loop, keeps the worker thread
+        # from iterating the cache dicts while handlers modify them
+        entities = {table: list(getattr(state, table).items()) for table in _TABLES}
+        await self._run(self._write, entities, dict(session))
+
+    async def load(self, state: ConnectionState) -> Dict[str, Any]:
+        """Fills `state` from the last snapshot and returns the saved session data"""
+        entities, session = await self._run(self._read)
+        for table, rows in entities.items():
+            getattr(state, table).update(rows)
+        return session
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=True)
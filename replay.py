@@ -0,0 +1,156 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import functools
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+class GatewayRecorder:
+    """Appends raw gateway frames, one "timestamp<TAB>frame" line each, to a gzip file.
+
+    Usage: bot.gateway_recorder = GatewayRecorder("traffic.log.gz")"""
+
+    def __init__(self, path: str, compresslevel: int = 6):
+        self.path = path
+        self.frames = 0
+        self._file = gzip.open(path, "at", encoding="utf-8", compresslevel=compresslevel)
+        # Compression runs on one worker thread, in order, so a multi-MB READY doesn't stall dispatch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="beehive-recorder")
+
+    def write(self, raw: str, timestamp: Optional[float] = None) -> None:
+        self._executor.submit(self._file.write, f"{time.time() if timestamp is None else timestamp:.6f}\t{raw}\n")
+        self.frames += 1
+
+    def close(self) -> None:
+        """Waits for queued frames to be written, then closes the file"""
+        self._executor.shutdown(wait=True)
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def read_frames(path: str) -> Iterator[Tuple[float, str]]:
+    """Yields (timestamp, raw frame) pairs from a GatewayRecorder file"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            timestamp, _, raw = line.rstrip("\n").partition("\t")
+            if raw:
+                yield float(timestamp), raw
+
+class _NullResponse:
+    status_code = 200
+    text = ""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.headers = {}
+        self._data = data
+
+    def json(self) -> Dict[str, Any]:
+        return self._data
+
+class _NullSession:
+    """Stands in for bot.session during a replay: answers every request with an empty 200"""
+
+    def __init__(self):
+        self.requests = 0
+
+    async def _request(self, method: str, url: str, json: Optional[Dict[str, Any]] = None, content: Any = None, **kwargs) -> _NullResponse:
+        self.requests += 1
+        if hasattr(content, "__aiter__"):
+            # Drain streamed uploads so their encoding cost is still measured
+            async for _ in content:
+                pass
+        return _NullResponse({"id": "0", **(json or {})})
+
+    def __getattr__(self, method: str):
+        if method not in ("get", "post", "put", "patch", "delete"):
+            raise AttributeError(method)
+        return functools.partial(self._request, method.upper())
+
+class _HandlerTimer:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        samples = self.samples.setdefault(name, [])
+
+        @functools.wraps(func)
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - start)
+        return timed
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            report[name] = {
+                "calls": len(ordered),
+                "mean_us": round(sum(ordered) / len(ordered) * 1e6, 2),
+                "p50_us": round(ordered[len(ordered) // 2] * 1e6, 2),
+                "p99_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6, 2),
+                "max_us": round(ordered[-1] * 1e6, 2),
+            }
+        return report
+
+async def replay(bot, path: str, realtime: bool = False, speed: float = 1.0, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Feeds a recorded frame stream through GatewayClient.dispatch_frame into `bot`
+    and returns events/sec and per-handler latency stats.
+
+    Runs offline: bot.session is swapped for a null transport while replaying,
+    so replayed commands don't hit the API. With realtime=True the recorded
+    gaps are kept (divided by `speed`)."""
+    from .gateway import GatewayClient
+
+    gateway = GatewayClient(bot.token, bot)
+    timer = _HandlerTimer()
+    session = bot.session
+    null_session = bot.session = _NullSession()
+    original_events = dict(bot.events)
+    for name, func in original_events.items():
+        bot.events[name] = timer.wrap(name, func)
+    bot.on_message = timer.wrap("on_message", bot.on_message)
+
+    frames = 0
+    first_ts = None
+    start = time.perf_counter()
+    try:
+        for timestamp, raw in read_frames(path):
+            if limit is not None and frames >= limit:
+                break
+            if realtime:
+                if first_ts is None:
+                    first_ts = timestamp
+                delay = (timestamp - first_ts) / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                await gateway.dispatch_frame(raw)
+            except Exception as e:
+                print(f"Error replaying frame {frames}: {e}")
+            frames += 1
+    finally:
+        elapsed = time.perf_counter() - start
+        bot.events.update(original_events)
+        del bot.on_message
+        bot.session = session
+
+    return {
+        "frames": frames,
+        "events": gateway.events_received,
+        "seconds": round(elapsed, 4),
+        "events_per_sec": round(gateway.events_received / elapsed, 1) if elapsed else 0.0,
+        "suppressed_requests": null_session.requests,
+        "handlers": timer.report(),
+    }
@@ -1,22 +1,20 @@
 # MIT License
 # Copyright (c) 2025 JinxedUp
-import random, asyncio, json, tls_client
+import random, asyncio, json
 from .utils import load_cookies, save_cookies
 from .constants import USER_AGENTS
 
 class RESTClient:
     def __init__(self, token):
+        # tls_client is only needed by this client, so it is imported here
+        # rather than at module level to keep it out of the package import chain
+        import tls_client
         self.token = token
-        self.session = aiohttp.ClientSession()
-
-    async def get_user_info(self):
-        """Get information about the bot user."""
-        url = "https://discord.com/api/v9/users/@me"
-        headers = {"Authorization": f"Bot {self.token}"}
-        async with self.session.get(url, headers=headers) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                print(f"Logged in as {data['username']}#{data['discriminator']}")
+        self.session = tls_client.Session(client_identifier="chrome_120")
+        self.session.headers.update({
+            "Authorization": token,
+            "User-Agent": random.choice(USER_AGENTS)
+        })
 
     async def get_user_info(self):
         """ Fetches the user info (selfbot's user ID) """
@@ -0,0 +1,262 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+IDENTIFY_INTERVAL = 5.0
+
+class _PipeChannel:
+    """Request/reply messaging over a multiprocessing Pipe, read by a daemon thread and answered by `on_request`"""
+
+    def __init__(self, conn, on_request: Callable):
+        self.conn = conn
+        self.on_request = on_request
+        self._ids = itertools.count()
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._send_lock = threading.Lock()
+        self._loop = None
+        self._closed = False
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self) -> None:
+        while True:
+            try:
+                msg = self.conn.recv()
+            except (EOFError, OSError):
+                try:
+                    self._loop.call_soon_threadsafe(self._fail_waiters)
+                except RuntimeError:
+                    pass
+                return
+            try:
+                self._loop.call_soon_threadsafe(self._dispatch, msg)
+            except RuntimeError:
+                return
+
+    def _fail_waiters(self) -> None:
+        """Fails every pending request once the other end has gone away (e.g. a worker died)"""
+        self._closed = True
+        waiters, self._waiters = self._waiters, {}
+        for waiter in waiters.values():
+            if not waiter.done():
+                waiter.set_exception(ConnectionError("IPC peer disconnected"))
+
+    def _send(self, msg) -> None:
+        with self._send_lock:
+            self.conn.send(msg)
+
+    def _dispatch(self, msg) -> None:
+        if msg[0] == "reply":
+            _, request_id, ok, value = msg
+            waiter = self._waiters.pop(request_id, None)
+            if waiter is not None and not waiter.done():
+                if ok:
+                    waiter.set_result(value)
+                else:
+                    waiter.set_exception(RuntimeError(value))
+        else:
+            asyncio.ensure_future(self._answer(*msg))
+
+    async def _answer(self, kind: str, request_id: int, payload: Any) -> None:
+        try:
+            reply = ("reply", request_id, True, await self.on_request(kind, payload))
+        except Exception as e:
+            reply = ("reply", request_id, False, f"{type(e).__name__}: {e}")
+        try:
+            self._send(reply)
+        except (OSError, ValueError) as e:
+            print(f"Error sending IPC reply: {e}")
+
+    async def request(self, kind: str, payload: Any = None, timeout: Optional[float] = None) -> Any:
+        """Sends a request and waits for its reply, raising ConnectionError if the
+        other end disconnects and asyncio.TimeoutError after `timeout` seconds"""
+        if self._closed:
+            raise ConnectionError("IPC peer disconnected")
+        request_id = next(self._ids)
+        waiter = self._loop.create_future()
+        self._waiters[request_id] = waiter
+        try:
+            self._send((kind, request_id, payload))
+        except (OSError, ValueError) as e:
+            self._waiters.pop(request_id, None)
+            raise ConnectionError(f"IPC send failed: {e}") from e
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        finally:
+            self._waiters.pop(request_id, None)
+
+class ShardIPC:
+    """Worker-side IPC handle, available as `bot.ipc` inside a shard process"""
+
+    def __init__(self, conn, bot):
+        self.bot = bot
+        self._channel = _PipeChannel(conn, self._on_request)
+
+    def start(self) -> None:
+        self._channel.start()
+
+    async def identify(self, shard_id: int) -> None:
+        """Waits for the manager's permission to IDENTIFY `shard_id`"""
+        await self._channel.request("identify", shard_id)
+
+    async def query(self, name: str, *args, timeout: Optional[float] = None) -> List[Any]:
+        """Runs the `name` IPC handler in every shard process and returns their results"""
+        return await self._channel.request("query", (name, args), timeout)
+
+    async def _on_request(self, kind: str, payload: Any) -> Any:
+        if kind != "query":
+            raise ValueError(f"Unknown IPC request: {kind}")
+        name, args = payload
+        if name == "stats":
+            return {shard_id: gateway.stats for shard_id, gateway in self.bot.shards.items()}
+        handler = self.bot.ipc_handlers.get(name)
+        if handler is None:
+            raise ValueError(f"No IPC handler named {name!r}")
+        result = handler(*args)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+def _run_worker(bot_factory: Callable, token: str, shard_ids: List[int], shard_count: int, conn) -> None:
+    async def main():
+        bot = bot_factory()
+        bot.ipc = ShardIPC(conn, bot)
+        bot.ipc.start()
+        async with bot:
+            await bot.start(token, shard_ids=shard_ids, shard_count=shard_count, identify_gate=bot.ipc.identify)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+class ShardManager:
+    """Runs a bot-token Bot as shards over worker processes, pacing IDENTIFYs and relaying cross-shard queries.
+
+    `bot_factory` is a module-level function returning a configured Bot, called once per worker."""
+
+    def __init__(self, bot_factory: Callable, token: str, shard_count: Optional[int] = None, processes: Optional[int] = None, max_concurrency: int = 1):
+        self.bot_factory = bot_factory
+        self.token = token
+        self.shard_count = shard_count
+        self.processes = processes
+        self.max_concurrency = max_concurrency
+        self._workers: List[multiprocessing.Process] = []
+        self._channels: List[_PipeChannel] = []
+        self._identify_locks: Dict[int, asyncio.Lock] = {}
+        self._last_identify: Dict[int, float] = {}
+
+    async def fetch_recommended(self) -> Dict[str, Any]:
+        """Returns the /gateway/bot response: url, shards and session_start_limit"""
+        import httpx
+        async with httpx.AsyncClient() as session:
+            response = await session.get(
+                "https://discord.com/api/v9/gateway/bot",
+                headers={"Authorization": f"Bot {self.token}"}
+            )
+        if response.status_code >= 400:
+            from .exceptions import HTTPError
+            raise HTTPError(response.status_code, response.text)
+        return response.json()
+
+    def _split(self) -> List[List[int]]:
+        processes = max(1, min(self.processes or os.cpu_count() or 1, self.shard_count))
+        size, extra = divmod(self.shard_count, processes)
+        blocks, start = [], 0
+        for i in range(processes):
+            end = start + size + (1 if i < extra else 0)
+            blocks.append(list(range(start, end)))
+            start = end
+        return blocks
+
+    async def start(self) -> None:
+        """Launches the worker processes and returns once they are running"""
+        if self.shard_count is None:
+            info = await self.fetch_recommended()
+            self.shard_count = info["shards"]
+            self.max_concurrency = info.get("session_start_limit", {}).get("max_concurrency", 1)
+        print(f"Launching {self.shard_count} shards with max_concurrency {self.max_concurrency}")
+
+        for shard_ids in self._split():
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=_run_worker,
+                args=(self.bot_factory, self.token, shard_ids, self.shard_count, child_conn),
+                name=f"beehive-shards-{shard_ids[0]}-{shard_ids[-1]}"
+            )
+            worker.start()
+            child_conn.close()
+            channel = _PipeChannel(parent_conn, self._on_request)
+            channel.start()
+            self._workers.append(worker)
+            self._channels.append(channel)
+
+    async def _on_request(self, kind: str, payload: Any) -> Any:
+        if kind == "identify":
+            await self._wait_identify(payload)
+            return None
+        if kind == "query":
+            name, args = payload
+            return await self.query(name, *args)
+        raise ValueError(f"Unknown IPC request: {kind}")
+
+    async def _wait_identify(self, shard_id: int) -> None:
+        bucket = shard_id % self.max_concurrency
+        lock = self._identify_locks.setdefault(bucket, asyncio.Lock())
+        async with lock:
+            delay = self._last_identify.get(bucket, 0.0) + IDENTIFY_INTERVAL - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_identify[bucket] = time.monotonic()
+
+    async def query(self, name: str, *args, timeout: Optional[float] = None) -> List[Any]:
+        """Runs the `name` IPC handler in every worker and returns their results in worker order"""
+        return list(await asyncio.gather(*(channel.request("query", (name, args), timeout) for channel in self._channels)))
+
+    async def stats(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Per-shard event/guild counts plus totals across all workers"""
+        shards = {}
+        for worker_stats in await self.query("stats", timeout=timeout):
+            shards.update(worker_stats)
+        return {
+            "shards": shards,
+            "events": sum(s["events"] for s in shards.values()),
+            "guilds": sum(s["guilds"] for s in shards.values()),
+        }
+
+    async def join(self) -> None:
+        """Waits until every worker process has exited"""
+        await asyncio.gather(*(asyncio.to_thread(worker.join) for worker in self._workers))
+
+    def close(self) -> None:
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in self._workers:
+            worker.join()
+        for channel in self._channels:
+            channel.conn.close()
+        self._workers.clear()
+        self._channels.clear()
+
+    def run(self) -> None:
+        """Starts all shards and blocks until they exit or the process is interrupted"""
+        async def runner():
+            try:
+                await self.start()
+                await self.join()
+            finally:
+                self.close()
+
+        try:
+            asyncio.run(runner())
+        except KeyboardInterrupt:
+            print("\nShard manager shutting down...")
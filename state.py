@@ -0,0 +1,87 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+from typing import Any, Dict, Optional
+from .snowflake import Snowflake, SnowflakeLike, parse_snowflake
+
+class ConnectionState:
+    """Cache of guild, channel and user payload dicts keyed by int snowflake, each entity held once"""
+
+    # Array fields of READY / GUILD_CREATE payloads that are fed into the
+    # cache element by element
+    ITEM_KEYS = ("guilds", "private_channels", "users", "members", "presences", "merged_members", "merged_presences")
+
+    def __init__(self):
+        self.guilds: Dict[Snowflake, Dict[str, Any]] = {}
+        self.channels: Dict[Snowflake, Dict[str, Any]] = {}
+        self.users: Dict[Snowflake, Dict[str, Any]] = {}
+
+    def get_guild(self, guild_id: SnowflakeLike) -> Optional[Dict[str, Any]]:
+        return self.guilds.get(parse_snowflake(guild_id))
+
+    def get_channel(self, channel_id: SnowflakeLike) -> Optional[Dict[str, Any]]:
+        return self.channels.get(parse_snowflake(channel_id))
+
+    def get_user(self, user_id: SnowflakeLike) -> Optional[Dict[str, Any]]:
+        return self.users.get(parse_snowflake(user_id))
+
+    def add_user(self, user: Optional[Dict[str, Any]]) -> None:
+        user_id = parse_snowflake(user.get("id")) if user else None
+        if user_id is not None:
+            self.users[user_id] = user
+
+    def add_channel(self, channel: Dict[str, Any], guild_id: Optional[Snowflake] = None) -> None:
+        channel_id = parse_snowflake(channel.get("id"))
+        if channel_id is None:
+            return
+        if guild_id is not None:
+            channel["guild_id"] = guild_id
+        self.channels[channel_id] = channel
+
+    def ingest_guild(self, guild: Dict[str, Any]) -> Optional[Snowflake]:
+        """Caches a READY or GUILD_CREATE guild payload, splitting out its channels and members"""
+        guild_id = parse_snowflake(guild.get("id"))
+        if guild_id is None:
+            return None
+        for key in ("channels", "threads"):
+            for channel in guild.pop(key, None) or ():
+                self.add_channel(channel, guild_id)
+        for member in guild.pop("members", None) or ():
+            self.add_user(member.get("user"))
+        guild.pop("presences", None)
+        self.guilds[guild_id] = guild
+        return guild_id
+
+    def ingest_item(self, key: str, item: Any) -> None:
+        """Caches one element of an ITEM_KEYS array"""
+        if key == "guilds":
+            self.ingest_guild(item)
+        elif key == "private_channels":
+            self.add_channel(item)
+            for recipient in item.get("recipients", ()):
+                self.add_user(recipient)
+        elif key == "users":
+            self.add_user(item)
+        elif key == "members":
+            self.add_user(item.get("user"))
+        # presences and merged_* lists aren't cached; they are dropped as they arrive
+
+    def ingest_ready(self, data: Dict[str, Any]) -> None:
+        """Caches a fully decoded READY payload"""
+        self.add_user(data.get("user"))
+        for key in self.ITEM_KEYS:
+            items = data.get(key)
+            if isinstance(items, list):
+                for item in items:
+                    # Guilds are copied so the dispatched payload keeps its channels and members
+                    self.ingest_item(key, dict(item) if key == "guilds" else item)
+
+    def remove_guild(self, guild_id: SnowflakeLike) -> None:
+        guild_id = parse_snowflake(guild_id)
+        self.guilds.pop(guild_id, None)
+        for channel_id in [cid for cid, channel in self.channels.items() if channel.get("guild_id") == guild_id]:
+            del self.channels[channel_id]
+
+    def clear(self) -> None:
+        self.guilds.clear()
+        self.channels.clear()
+        self.users.clear()
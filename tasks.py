@@ -0,0 +1,338 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Callable, List, Optional, Set
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+
+class _Timer:
+    __slots__ = ("expires", "callback", "slot", "deadline")
+
+    def __init__(self, expires: int, deadline: float, callback: Callable[[], None]):
+        self.expires = expires
+        self.deadline = deadline
+        self.callback = callback
+        self.slot: Optional[Set["_Timer"]] = None
+
+class TimerWheel:
+    """Hierarchical timer wheel (4 levels of 64 slots) driving every scheduled task from one asyncio task"""
+
+    def __init__(self, tick: float = 0.1):
+        self.tick = tick
+        self._levels: List[List[Set[_Timer]]] = [[set() for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        self._current = 0
+        self._origin: Optional[float] = None
+        self._count = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) / self.tick)
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> _Timer:
+        """Schedules callback() at the time.monotonic() `deadline`, rounded up to the next tick"""
+        if self._origin is None:
+            self._origin = time.monotonic()
+        elif not self._count:
+            # The driver doesn't tick while idle; catch up before computing slots
+            self._current = max(self._current, self._now_tick())
+        expires = max(self._current + 1, math.ceil((deadline - self._origin) / self.tick))
+        timer = _Timer(expires, deadline, callback)
+        self._insert(timer)
+        self._count += 1
+        self._ensure_running()
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> _Timer:
+        return self.call_at(time.monotonic() + delay, callback)
+
+    def cancel(self, timer: _Timer) -> None:
+        if timer.slot is not None:
+            timer.slot.discard(timer)
+            timer.slot = None
+            self._count -= 1
+
+    def _insert(self, timer: _Timer) -> None:
+        delta = timer.expires - self._current
+        for level in range(_LEVELS):
+            if delta < 1 << (_SLOT_BITS * (level + 1)) or level == _LEVELS - 1:
+                # Timers past the top level's span park in its furthest slot and re-cascade
+                expires = min(timer.expires, self._current + (1 << (_SLOT_BITS * _LEVELS)) - 1)
+                slot = self._levels[level][(expires >> (_SLOT_BITS * level)) & _SLOT_MASK]
+                break
+        slot.add(timer)
+        timer.slot = slot
+
+    def _cascade(self, level: int) -> None:
+        slot = self._levels[level][(self._current >> (_SLOT_BITS * level)) & _SLOT_MASK]
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            self._insert(timer)
+
+    def _advance(self) -> None:
+        self._current += 1
+        for level in range(1, _LEVELS):
+            if (self._current >> (_SLOT_BITS * (level - 1))) & _SLOT_MASK:
+                break
+            self._cascade(level)
+
+        slot = self._levels[0][self._current & _SLOT_MASK]
+        if not slot:
+            return
+        due = [timer for timer in slot if timer.expires <= self._current]
+        for timer in due:
+            slot.discard(timer)
+            timer.slot = None
+            self._count -= 1
+        for timer in due:
+            try:
+                timer.callback()
+            except Exception as e:
+                print(f"Error in timer callback: {e}")
+
+    def _ticks_to_next(self) -> int:
+        """Ticks until the next occupied level 0 slot or the next cascade point"""
+        for step in range(1, _SLOTS - (self._current & _SLOT_MASK) + 1):
+            tick = self._current + step
+            if tick & _SLOT_MASK == 0 or self._levels[0][tick & _SLOT_MASK]:
+                return step
+        return _SLOTS
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        else:
+            # A new timer may be due before the driver's current sleep ends
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._count:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            target = self._current + self._ticks_to_next()
+            delay = self._origin + target * self.tick - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            now_tick = self._now_tick()
+            while self._current < now_tick:
+                self._advance()
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+class CronSchedule:
+    """A five-field cron expression (minute hour day-of-month month day-of-week, 0 or 7 = Sunday)"""
+
+    _RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+    def __init__(self, expression: str, tz: tzinfo = timezone.utc):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(fields)}: {expression!r}")
+        self.expression = expression
+        self.tz = tz
+        parsed = [self._parse_field(field, low, high, i == 4) for i, (field, (low, high)) in enumerate(zip(fields, self._RANGES))]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int, weekday: bool) -> Set[int]:
+        values = set()
+        for part in field.split(","):
+            base, _, step = part.partition("/")
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(v) for v in base.split("-", 1))
+            else:
+                start = end = int(base)
+                if step:
+                    end = high
+            if weekday:
+                high = 7
+            if not (low <= start <= end <= high):
+                raise ValueError(f"Cron field {field!r} out of range {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        if weekday and 7 in values:
+            values.discard(7)
+            values.add(0)
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """Returns the first matching minute strictly after `after`"""
+        dt = after.astimezone(self.tz).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(100000):
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+            elif dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+class Loop:
+    """A repeating background task run every `seconds` or on a `cron` schedule; runs never overlap"""
+
+    def __init__(self, coro: Callable, wheel: TimerWheel, seconds: Optional[float] = None, cron: Optional[str] = None, count: Optional[int] = None, jitter: float = 0.0):
+        if (seconds is None) == (cron is None):
+            raise ValueError("Loop needs exactly one of seconds or cron")
+        if seconds is not None and seconds <= 0:
+            raise ValueError("Loop interval must be positive")
+        self.coro = coro
+        self.wheel = wheel
+        self.seconds = seconds
+        self.cron = CronSchedule(cron) if cron else None
+        self.count = count
+        self.jitter = jitter
+        self.current_loop = 0
+        self.failures = 0
+        self.last_drift = 0.0
+        self.max_drift = 0.0
+        self._total_drift = 0.0
+        self._args = ()
+        self._kwargs = {}
+        self._timer = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        # Bumped by start() and stop(); timers and runs from an older generation do nothing
+        self._generation = 0
+        self._deferred = False
+        self._scheduled: Optional[float] = None
+        self._error_handler: Optional[Callable] = None
+
+    def error(self, func: Callable) -> Callable:
+        """Decorator to set the error handler, called as func(exception)"""
+        self._error_handler = func
+        return func
+
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def drift(self) -> dict:
+        return {
+            "last": self.last_drift,
+            "max": self.max_drift,
+            "mean": self._total_drift / self.current_loop if self.current_loop else 0.0,
+        }
+
+    def start(self, *args, **kwargs) -> None:
+        if self._running:
+            raise RuntimeError(f"Loop {self.coro.__name__} is already running")
+        self._args, self._kwargs = args, kwargs
+        self._running = True
+        self._generation += 1
+        self.current_loop = 0
+        self._scheduled = None
+        if self._task is not None:
+            # A run from before stop() is still going; start once it finishes so runs never overlap
+            self._deferred = True
+        else:
+            self._schedule_next()
+
+    def stop(self) -> None:
+        """Stops scheduling new runs; a run in progress is allowed to finish"""
+        self._running = False
+        self._generation += 1
+        self._deferred = False
+        if self._timer is not None:
+            self.wheel.cancel(self._timer)
+            self._timer = None
+
+    def cancel(self) -> None:
+        """Stops the loop and cancels a run in progress"""
+        self.stop()
+        if self._task is not None:
+            self._task.cancel()
+
+    def restart(self, *args, **kwargs) -> None:
+        self.cancel()
+        self.start(*(args or self._args), **(kwargs or self._kwargs))
+
+    def _schedule_next(self) -> None:
+        if not self._running or (self.count is not None and self.current_loop >= self.count):
+            self._running = False
+            return
+        now = time.monotonic()
+        if self.cron is not None:
+            wall = datetime.now(timezone.utc)
+            scheduled = now + (self.cron.next_after(wall) - wall).total_seconds()
+        elif self._scheduled is None:
+            scheduled = now
+        else:
+            scheduled = self._scheduled + self.seconds
+            if scheduled < now:
+                # Skip missed runs instead of firing them back to back
+                scheduled += math.ceil((now - scheduled) / self.seconds) * self.seconds
+        self._scheduled = scheduled
+        if self.jitter:
+            scheduled += random.uniform(0, self.jitter)
+        generation = self._generation
+        self._timer = self.wheel.call_at(scheduled, lambda: self._fire(generation, scheduled))
+
+    def _fire(self, generation: int, scheduled: float) -> None:
+        if generation != self._generation or not self._running:
+            return
+        self._timer = None
+        drift = time.monotonic() - scheduled
+        self.last_drift = drift
+        self.max_drift = max(self.max_drift, drift)
+        self._total_drift += drift
+        self._task = asyncio.create_task(self._run_once(generation))
+
+    async def _run_once(self, generation: int) -> None:
+        self.current_loop += 1
+        cancelled = False
+        try:
+            await self.coro(*self._args, **self._kwargs)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as e:
+            self.failures += 1
+            if self._error_handler is not None:
+                try:
+                    await self._error_handler(e)
+                except Exception as handler_error:
+                    print(f"Error in loop {self.coro.__name__} error handler: {handler_error}")
+            else:
+                print(f"Error in loop {self.coro.__name__}: {e}")
+        finally:
+            self._task = None
+            if generation == self._generation:
+                if not cancelled:
+                    self._schedule_next()
+            elif self._deferred:
+                self._deferred = False
+                self._schedule_next()
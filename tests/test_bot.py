@@ -0,0 +1,35 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import pytest
+
+pytest.importorskip("httpx")
+
+from beehive.bot import Bot
+
+def test_close_from_a_command():
+    async def main():
+        bot = Bot()
+        bot.user_id = 1
+        closed_from = []
+
+        @bot.command()
+        async def logout(ctx):
+            closed_from.append(asyncio.current_task())
+            await ctx.bot.close()
+
+        async def shard():
+            # Stands in for GatewayClient.connect dispatching a frame
+            await bot.handle({"_event_type": "MESSAGE_CREATE", "author": {"id": "1"}, "channel_id": "2", "content": "!logout"})
+            await asyncio.sleep(3600)
+
+        async def connect(*args):
+            await asyncio.gather(shard())
+
+        bot.connect = connect
+        await asyncio.wait_for(bot.start("token"), 5)
+        assert closed_from
+        assert bot.is_closed
+        await asyncio.wait_for(bot.close(), 5)
+
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import json
+import pytest
+
+pytest.importorskip("httpx_ws")
+
+from beehive.benchmarks.ready_memory import make_ready_frame
+from beehive.gateway import STREAM_THRESHOLD, GatewayClient
+from beehive.state import ConnectionState
+
+class _Handler:
+    def __init__(self):
+        self.state = ConnectionState()
+        self.user_id = None
+        self.events = []
+
+    async def handle(self, event):
+        self.events.append(event)
+
+def _dispatch(raw):
+    handler = _Handler()
+    asyncio.run(GatewayClient("token", handler).dispatch_frame(raw))
+    return handler
+
+def _guild_create(members):
+    guild = json.loads(make_ready_frame(1, members))["d"]["guilds"][0]
+    return json.dumps({"op": 0, "s": 2, "t": "GUILD_CREATE", "d": guild})
+
+@pytest.mark.parametrize("make_frame, small, large", [
+    (make_ready_frame, (2, 5), (60, 200)),
+    (lambda guilds, members: _guild_create(members), (1, 5), (1, 3000)),
+])
+def test_event_shape_does_not_depend_on_frame_size(make_frame, small, large):
+    small_raw, large_raw = make_frame(*small), make_frame(*large)
+    assert len(small_raw) < STREAM_THRESHOLD <= len(large_raw)
+    small_handler, large_handler = _dispatch(small_raw), _dispatch(large_raw)
+    small_event, large_event = small_handler.events[0], large_handler.events[0]
+
+    assert set(small_event) == set(large_event)
+    assert "members" not in small_event and "presences" not in small_event
+    if small_event["_event_type"] == "READY":
+        assert all(set(guild) == {"id", "unavailable"} for guild in small_event["guilds"])
+        assert len(small_handler.state.guilds) == small[0]
+    assert len(small_handler.state.users) >= small[1]
+    assert len(large_handler.state.users) >= large[1]
@@ -0,0 +1,89 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import time
+from beehive.outbound import OutboundQueue
+
+class _Response:
+    def __init__(self, status_code=200, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+
+def test_queued_edits_coalesce_into_one_request():
+    async def main():
+        queue = OutboundQueue()
+        release = asyncio.Event()
+        calls = []
+
+        async def blocking_send():
+            await release.wait()
+            calls.append("POST")
+            return _Response()
+
+        def edit(content):
+            async def factory():
+                calls.append(("PATCH", content))
+                return _Response(body=content)
+            return factory
+
+        first = asyncio.create_task(queue.submit(1, "POST", blocking_send))
+        await asyncio.sleep(0)
+        edits = [asyncio.create_task(queue.submit(1, "PATCH", edit(i), coalesce_key=99)) for i in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        await first
+        responses = await asyncio.gather(*edits)
+        assert calls == ["POST", ("PATCH", 4)]
+        assert {response.body for response in responses} == {4}
+        assert queue.stats["coalesced"] == 4
+        await queue.close()
+
+    asyncio.run(main())
+
+def test_requests_keep_per_channel_order():
+    async def main():
+        queue = OutboundQueue()
+        order = {1: [], 2: []}
+
+        def send(channel_id, i):
+            async def factory():
+                # Later requests finish faster, so only the queue keeps them in order
+                await asyncio.sleep(0.001 * (5 - i))
+                order[channel_id].append(i)
+                return _Response()
+            return factory
+
+        await asyncio.gather(*(queue.submit(channel_id, "POST", send(channel_id, i)) for i in range(5) for channel_id in (1, 2)))
+        assert order == {1: [0, 1, 2, 3, 4], 2: [0, 1, 2, 3, 4]}
+        await queue.close()
+
+    asyncio.run(main())
+
+def test_global_rate_limit_pauses_every_channel():
+    async def main():
+        queue = OutboundQueue()
+        sent_at = {}
+        limited = []
+
+        async def globally_limited():
+            if not limited:
+                limited.append(time.monotonic())
+                return _Response(429, {"Retry-After": "0.2", "X-RateLimit-Global": "true"})
+            sent_at[1] = time.monotonic()
+            return _Response()
+
+        async def other_channel():
+            sent_at[2] = time.monotonic()
+            return _Response()
+
+        first = asyncio.create_task(queue.submit(1, "POST", globally_limited))
+        await asyncio.sleep(0.05)
+        await queue.submit(2, "POST", other_channel)
+        await first
+        assert sent_at[1] - limited[0] >= 0.2
+        assert sent_at[2] - limited[0] >= 0.2
+        assert queue.stats["global_rate_limited"] == 1
+        await queue.close()
+
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import multiprocessing
+import pytest
+from beehive.sharding import _PipeChannel
+
+def _pair(on_request):
+    left, right = multiprocessing.Pipe()
+    async def unused(kind, payload):
+        raise AssertionError("unexpected request")
+    return _PipeChannel(left, unused), _PipeChannel(right, on_request), right
+
+def test_request_roundtrip():
+    async def main():
+        async def on_request(kind, payload):
+            return (kind, payload * 2)
+        client, server, _ = _pair(on_request)
+        client.start()
+        server.start()
+        assert await client.request("double", 21, timeout=5) == ("double", 42)
+
+    asyncio.run(main())
+
+def test_pending_requests_fail_when_peer_disconnects():
+    async def main():
+        async def on_request(kind, payload):
+            await asyncio.sleep(3600)
+        client, _, server_conn = _pair(on_request)
+        client.start()
+        pending = asyncio.create_task(client.request("query", None))
+        await asyncio.sleep(0.05)
+        server_conn.close()
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(pending, 5)
+        with pytest.raises(ConnectionError):
+            await client.request("query", None)
+
+    asyncio.run(main())
+
+def test_request_timeout():
+    async def main():
+        async def on_request(kind, payload):
+            await asyncio.sleep(3600)
+        client, server, _ = _pair(on_request)
+        client.start()
+        server.start()
+        with pytest.raises(asyncio.TimeoutError):
+            await client.request("query", None, timeout=0.1)
+        assert not client._waiters
+
+    asyncio.run(main())
@@ -0,0 +1,153 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+import pytest
+from beehive.tasks import CronSchedule, Loop, TimerWheel
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+def test_wheel_fires_timers_on_time():
+    async def main():
+        wheel = TimerWheel(tick=0.005)
+        random.seed(0)
+        fired = []
+        start = time.monotonic()
+        for _ in range(200):
+            # Up to 0.5s spans levels 0 and 1, so this also exercises cascading
+            deadline = start + random.uniform(0, 0.5)
+            wheel.call_at(deadline, lambda deadline=deadline: fired.append((deadline, time.monotonic())))
+        await asyncio.sleep(0.6)
+        wheel.stop()
+        assert len(fired) == 200
+        assert len(wheel) == 0
+        lateness = [actual - deadline for deadline, actual in fired]
+        assert min(lateness) >= 0
+        assert max(lateness) < 0.1
+
+    asyncio.run(main())
+
+def test_wheel_cancel():
+    async def main():
+        wheel = TimerWheel(tick=0.005)
+        fired = []
+        keep = wheel.call_later(0.05, lambda: fired.append("keep"))
+        drop = wheel.call_later(0.05, lambda: fired.append("drop"))
+        wheel.cancel(drop)
+        wheel.cancel(drop)
+        assert len(wheel) == 1
+        await asyncio.sleep(0.15)
+        wheel.stop()
+        assert fired == ["keep"]
+        assert keep.slot is None
+
+    asyncio.run(main())
+
+@pytest.mark.parametrize("expression, after, expected", [
+    ("0 9 * * 1-5", _utc(2026, 10, 19, 8, 59), _utc(2026, 10, 19, 9, 0)),
+    ("0 9 * * 1-5", _utc(2026, 10, 19, 9, 0), _utc(2026, 10, 20, 9, 0)),
+    ("0 9 * * 1-5", _utc(2026, 10, 23, 10, 0), _utc(2026, 10, 26, 9, 0)),
+    ("*/15 * * * *", _utc(2026, 10, 19, 10, 7, 30), _utc(2026, 10, 19, 10, 15)),
+    ("*/15 * * * *", _utc(2026, 10, 19, 10, 59), _utc(2026, 10, 19, 11, 0)),
+    ("0 0 29 2 *", _utc(2026, 3, 1), _utc(2028, 2, 29)),
+    # Both day fields restricted: either one matching is enough
+    ("30 4 1,15 * 5", _utc(2026, 10, 19), _utc(2026, 10, 23, 4, 30)),
+    ("0 0 * * 7", _utc(2026, 10, 19), _utc(2026, 10, 25)),
+    ("0-30/10 12 * 12 *", _utc(2026, 10, 19), _utc(2026, 12, 1, 12, 0)),
+])
+def test_cron_next_after(expression, after, expected):
+    assert CronSchedule(expression).next_after(after) == expected
+
+@pytest.mark.parametrize("expression", ["* * * *", "61 * * * *", "* 24 * * *", "5-1 * * * *", "0 0 31 2 *"])
+def test_cron_rejects_bad_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression).next_after(_utc(2026, 1, 1))
+
+def test_loop_isolates_errors_and_honours_count():
+    async def main():
+        wheel = TimerWheel(tick=0.005)
+        runs = []
+
+        async def job():
+            runs.append(time.monotonic())
+            if len(runs) == 2:
+                raise RuntimeError("boom")
+
+        loop = Loop(job, wheel, seconds=0.02, count=4)
+        errors = []
+        @loop.error
+        async def on_error(e):
+            errors.append(e)
+
+        loop.start()
+        await asyncio.sleep(0.3)
+        wheel.stop()
+        assert len(runs) == 4
+        assert loop.failures == 1 and len(errors) == 1
+        assert not loop.is_running()
+
+    asyncio.run(main())
+
+def test_stop_and_start_during_a_run_never_overlaps():
+    async def main():
+        wheel = TimerWheel(tick=0.005)
+        active = 0
+        overlap = []
+        runs = []
+
+        async def job():
+            nonlocal active
+            active += 1
+            overlap.append(active)
+            runs.append(time.monotonic())
+            await asyncio.sleep(0.06)
+            active -= 1
+
+        loop = Loop(job, wheel, seconds=0.1)
+        loop.start()
+        await asyncio.sleep(0.03)
+        loop.stop()
+        loop.start()
+        await asyncio.sleep(0.02)
+        # The restarted loop waits for the old run instead of starting a second one
+        assert len(runs) == 1
+        await asyncio.sleep(0.2)
+        loop.stop()
+        stopped_at = len(runs)
+        await asyncio.sleep(0.3)
+        wheel.stop()
+        assert max(overlap) == 1
+        assert stopped_at >= 2
+        assert len(runs) == stopped_at
+
+    asyncio.run(main())
+
+def test_restart_cancels_the_running_run():
+    async def main():
+        wheel = TimerWheel(tick=0.005)
+        cancelled = []
+        runs = []
+
+        async def job():
+            runs.append(time.monotonic())
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        loop = Loop(job, wheel, seconds=0.5)
+        loop.start()
+        await asyncio.sleep(0.02)
+        loop.restart()
+        await asyncio.sleep(0.05)
+        assert cancelled == [True]
+        assert len(runs) == 2
+        loop.cancel()
+        await asyncio.sleep(0.01)
+        wheel.stop()
+
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+from beehive.triggers import Trigger, TriggerMatcher
+
+async def _noop(ctx, match):
+    pass
+
+def _matcher(*regexes):
+    matcher = TriggerMatcher()
+    triggers = []
+    for pattern in regexes:
+        async def callback(ctx, match):
+            pass
+        trigger = Trigger(callback, [], [pattern], False, True)
+        matcher.add(trigger)
+        triggers.append(trigger)
+    return matcher, triggers
+
+def test_backreference_alongside_other_groups():
+    matcher, (_, backref) = _matcher("(x)", r"(a)\1")
+    matches = matcher.match("aa")
+    assert [trigger for trigger, _ in matches] == [backref]
+    assert matches[0][1].group(0) == "aa"
+
+def test_backreference_alone():
+    matcher, (backref,) = _matcher(r"(a)\1")
+    assert [trigger for trigger, _ in matcher.match("xaay")] == [backref]
+    assert matcher.match("ab") == []
+
+def test_named_backreference_and_duplicate_group_names():
+    matcher, triggers = _matcher(r"(?P<w>b)(?P=w)", "(?P<w>c)d", "(?P<w>e)f")
+    assert [trigger for trigger, _ in matcher.match("bb cd ef")] == triggers
+    assert matcher.match("bc") == []
+
+def test_combined_patterns_keep_their_own_groups():
+    matcher, (first, second) = _matcher(r"(\d+) apples", r"(\w+) pears")
+    matches = dict(matcher.match("3 apples and ripe pears"))
+    assert matches[first].group(1) == "3"
+    assert matches[second].group(1) == "ripe"
+
+def test_keywords_and_regexes_in_registration_order():
+    matcher = TriggerMatcher()
+    regex = Trigger(_noop, [], [r"(a)\1"], False, True)
+    keyword = Trigger(_noop, ["Hello"], [], False, True)
+    matcher.add(regex)
+    matcher.add(keyword)
+    assert [trigger for trigger, _ in matcher.match("hello aa")] == [regex, keyword]
+
+def test_regexes_matching_after_the_first_hit_are_found():
+    matcher, triggers = _matcher(r"\w+", r"zz\d", r"^ab", r"(?<=b )zz")
+    assert [trigger for trigger, _ in matcher.match("ab zz1")] == triggers
+    assert [trigger for trigger, _ in matcher.match("xx yy")] == triggers[:1]
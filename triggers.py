@@ -0,0 +1,180 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import re
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+# Numbered or named backreferences and group conditionals; these refer to
+# groups by number or name, which change meaning inside the combined pattern
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+class AhoCorasick:
+    """Aho-Corasick automaton: add() keywords, build(), then search() yields (end_index, keyword, value) in one pass"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Any]]] = [[]]
+
+    def add(self, keyword: str, value: Any) -> None:
+        node = 0
+        for char in keyword:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((keyword, value))
+
+    def build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                if node:
+                    fail = self._fail[node]
+                    while fail and char not in self._goto[fail]:
+                        fail = self._fail[fail]
+                    self._fail[nxt] = self._goto[fail].get(char, 0)
+                # Inherit the matches of the longest proper suffix
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def search(self, text: str):
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                for keyword, value in out[node]:
+                    yield index, keyword, value
+
+class Trigger:
+    def __init__(self, callback: Callable, keywords: List[str], regexes: List[str], case_sensitive: bool, ignore_self: bool):
+        self.callback = callback
+        self.keywords = keywords
+        self.regexes = regexes
+        self.case_sensitive = case_sensitive
+        self.ignore_self = ignore_self
+
+class TriggerMatcher:
+    """Matches a message against every trigger: keywords via Aho-Corasick, regexes via one combined lookahead scan"""
+
+    def __init__(self):
+        self.triggers: List[Trigger] = []
+        self._dirty = True
+        self._sensitive: Optional[AhoCorasick] = None
+        self._insensitive: Optional[AhoCorasick] = None
+        self._combined: Optional[re.Pattern] = None
+        self._fallback: List[Tuple[re.Pattern, Trigger]] = []
+        self._groups: Dict[str, Tuple[re.Pattern, Trigger]] = {}
+        self._order: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def add(self, trigger: Trigger) -> None:
+        self.triggers.append(trigger)
+        self._dirty = True
+
+    def remove(self, callback: Callable) -> None:
+        self.triggers = [t for t in self.triggers if t.callback is not callback]
+        self._dirty = True
+
+    def remove_triggers(self, triggers: List[Trigger]) -> None:
+        ids = {id(t) for t in triggers}
+        self.triggers = [t for t in self.triggers if id(t) not in ids]
+        self._dirty = True
+
+    @staticmethod
+    def _can_combine(compiled: re.Pattern, alternative: str, names: Set[str]) -> bool:
+        """False for regexes that must be searched on their own: backreferences, reused group names, or wrap failures"""
+        if _GROUP_REFERENCE.search(compiled.pattern) or names.intersection(compiled.groupindex):
+            return False
+        try:
+            re.compile(alternative)
+        except re.error:
+            return False
+        return True
+
+    def _build(self) -> None:
+        self._sensitive = AhoCorasick()
+        self._insensitive = AhoCorasick()
+        has_sensitive = has_insensitive = False
+        alternatives = []
+        self._groups = {}
+        self._fallback = []
+        self._order = {id(t): i for i, t in enumerate(self.triggers)}
+        names: Set[str] = set()
+        for i, trigger in enumerate(self.triggers):
+            for keyword in trigger.keywords:
+                if trigger.case_sensitive:
+                    self._sensitive.add(keyword, trigger)
+                    has_sensitive = True
+                else:
+                    self._insensitive.add(keyword.casefold(), trigger)
+                    has_insensitive = True
+            for j, pattern in enumerate(trigger.regexes):
+                compiled = re.compile(pattern, 0 if trigger.case_sensitive else re.IGNORECASE)
+                group = f"_trigger{i}_{j}"
+                inner = pattern if trigger.case_sensitive else f"(?i:{pattern})"
+                alternative = f"(?=(?P<{group}>{inner}))"
+                if self._can_combine(compiled, alternative, names):
+                    names.update(compiled.groupindex)
+                    alternatives.append(alternative)
+                    self._groups[group] = (compiled, trigger)
+                else:
+                    self._fallback.append((compiled, trigger))
+        self._sensitive.build()
+        self._insensitive.build()
+        if not has_sensitive:
+            self._sensitive = None
+        if not has_insensitive:
+            self._insensitive = None
+
+        self._combined = None
+        if alternatives:
+            try:
+                self._combined = re.compile("|".join(alternatives))
+            except re.error:
+                self._fallback.extend(self._groups.values())
+                self._groups = {}
+        self._dirty = False
+
+    def match(self, content: str) -> List[Tuple[Trigger, Union[str, re.Match]]]:
+        """Returns (trigger, match) for each trigger matching `content`, in registration order.
+
+        `match` is the matched keyword or the re.Match of the first matching regex."""
+        if self._dirty:
+            self._build()
+        found: Dict[int, Tuple[Trigger, Union[str, re.Match]]] = {}
+        if self._sensitive is not None:
+            for _, keyword, trigger in self._sensitive.search(content):
+                found.setdefault(id(trigger), (trigger, keyword))
+        if self._insensitive is not None:
+            for _, keyword, trigger in self._insensitive.search(content.casefold()):
+                found.setdefault(id(trigger), (trigger, keyword))
+        if self._combined is not None:
+            first = self._combined.search(content)
+            if first is not None:
+                # No regex can match before the combined pattern's first hit, so
+                # searching each from there once finds them all (with their own groups)
+                position = first.start()
+                for pattern, trigger in self._groups.values():
+                    if id(trigger) not in found:
+                        own = pattern.search(content, position)
+                        if own:
+                            found[id(trigger)] = (trigger, own)
+        for pattern, trigger in self._fallback:
+            if id(trigger) not in found:
+                m = pattern.search(content)
+                if m:
+                    found[id(trigger)] = (trigger, m)
+        if len(found) > 1:
+            return sorted(found.values(), key=lambda item: self._order[id(item[0])])
+        return list(found.values())
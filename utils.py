@@ -1,14 +1,40 @@
 # MIT License
 # Copyright (c) 2025 JinxedUp
-import os, json
+import os, json, asyncio
 
-def load_cookies():
-    if os.path.exists("cookies.json"):
-        with open("cookies.json", 'r') as f:
-            try: return json.load(f)
-            except: return {}
-    return {}
+def load_cookies(path="cookies.json"):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error loading cookies from {path}: {e}")
+        return {}
 
-def save_cookies(cookies):
-    with open("cookies.json", 'w') as f:
+def save_cookies(cookies, path="cookies.json"):
+    """Writes cookies atomically: a temp file is written then renamed over `path`"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
         json.dump(cookies, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+async def load_cookies_async(path="cookies.json"):
+    """load_cookies run in a worker thread, for use from async code"""
+    return await asyncio.to_thread(load_cookies, path)
+
+async def save_cookies_async(cookies, path="cookies.json"):
+    """save_cookies run in a worker thread, for use from async code"""
+    await asyncio.to_thread(save_cookies, cookies, path)
+
+def install_uvloop():
+    """Sets uvloop's event loop policy so new event loops run on uvloop.
+
+    Raises ImportError if uvloop is not installed."""
+    try:
+        import uvloop
+    except ImportError:
+        raise ImportError("uvloop is not installed, install it with `pip install uvloop`") from None
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -0,0 +1,117 @@
+# MIT License
+# Copyright (c) 2025 JinxedUp
+import asyncio
+import contextlib
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+def _label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+def _thread_stack(frame) -> List[str]:
+    stack = []
+    while frame is not None:
+        stack.append(_label(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+def _await_stack(coro) -> List[str]:
+    stack = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        stack.append(_label(frame))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return stack
+
+class _Watch:
+    __slots__ = ("name", "task", "started", "samples")
+
+    def __init__(self, name: str, task: Optional[asyncio.Task]):
+        self.name = name
+        self.task = task
+        self.started = time.perf_counter()
+        self.samples: Counter = Counter()
+
+class SlowHandlerWatchdog:
+    """Flags handlers slower than `threshold` seconds and writes sampled stacks as collapsed-stack profiles.
+
+    Enable with `bot.watchdog = SlowHandlerWatchdog(...)`."""
+
+    def __init__(self, threshold: float = 0.5, interval: float = 0.005, output_dir: str = "profiles"):
+        self.threshold = threshold
+        self.interval = interval
+        self.output_dir = output_dir
+        self.slow_calls = 0
+        self._active: Dict[int, _Watch] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+
+    @contextlib.asynccontextmanager
+    async def watch(self, name: str):
+        """Times the enclosed handler call, sampling it once it runs past the threshold"""
+        if self._thread is None:
+            self._loop_thread_id = threading.get_ident()
+            self._thread = threading.Thread(target=self._sample_loop, name="beehive-watchdog", daemon=True)
+            self._thread.start()
+
+        watch = _Watch(name, asyncio.current_task())
+        with self._lock:
+            self._active[id(watch)] = watch
+        self._wakeup.set()
+        try:
+            yield
+        finally:
+            with self._lock:
+                del self._active[id(watch)]
+            elapsed = time.perf_counter() - watch.started
+            if elapsed > self.threshold:
+                self._report(watch, elapsed)
+
+    def _sample_loop(self) -> None:
+        while True:
+            with self._lock:
+                # Cleared before the snapshot, so a watch added after it has
+                # always set the event again and the wait below returns at once
+                self._wakeup.clear()
+                watches = list(self._active.values())
+            if not watches:
+                self._wakeup.wait()
+                continue
+
+            now = time.perf_counter()
+            overdue = [w for w in watches if now - w.started > self.threshold]
+            if overdue:
+                loop_frame = sys._current_frames().get(self._loop_thread_id)
+                for watch in overdue:
+                    coro = watch.task.get_coro() if watch.task is not None else None
+                    if coro is not None and not getattr(coro, "cr_running", False):
+                        stack = ["[awaiting]"] + _await_stack(coro)
+                    else:
+                        stack = _thread_stack(loop_frame)
+                    if stack:
+                        watch.samples[";".join(stack)] += 1
+            time.sleep(self.interval)
+
+    def _report(self, watch: _Watch, elapsed: float) -> None:
+        self.slow_calls += 1
+        message = f"Slow handler: {watch.name} took {elapsed:.3f}s (threshold {self.threshold:.3f}s)"
+        if watch.samples:
+            os.makedirs(self.output_dir, exist_ok=True)
+            safe_name = re.sub(r"[^\w.-]+", "_", watch.name)
+            path = os.path.join(self.output_dir, f"{safe_name}-{int(time.time() * 1000)}.folded")
+            with open(path, "w") as f:
+                for stack, count in watch.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            message += f", {sum(watch.samples.values())} samples written to {path}"
+        print(f"WARNING: {message}")